@@ -0,0 +1,7 @@
+from django.urls import path
+from .dashboard_views import DashboardView
+
+# Included by the project URLconf only when ENABLE_DASHBOARD is set, the view is only imported here
+urlpatterns = [
+    path('', DashboardView.as_view(), name='dashboard'),
+]
@@ -0,0 +1,8 @@
+from django.views.generic import TemplateView
+
+
+class DashboardView(TemplateView):
+    '''
+    View for rendering the dashboard template.
+    '''
+    template_name = "emissions/dashboard.html"
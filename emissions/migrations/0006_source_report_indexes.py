@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-14 03:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emissions', '0005_alter_source_emission_factor_alter_source_quantity_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='source',
+            index=models.Index(fields=['report', 'acquisition_year'], name='emissions_s_report__f9ce98_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='source',
+            index=models.Index(fields=['report', 'year'], name='emissions_s_report__60a51e_idx'),
+        ),
+    ]
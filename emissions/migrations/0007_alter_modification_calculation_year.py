@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-14 03:20
+
+import emissions.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emissions', '0006_source_report_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='modification',
+            name='calculation_year',
+            field=models.PositiveSmallIntegerField(default=emissions.models._current_year, help_text='Specific year for which this modification is calculated'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-14 03:33
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emissions', '0007_alter_modification_calculation_year'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='stored_annual_emission',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.functions.comparison.Cast('emission_factor', models.FloatField()), '*', django.db.models.functions.comparison.Cast('value', models.FloatField())), '*', django.db.models.functions.comparison.Cast('quantity', models.FloatField())), output_field=models.FloatField()),
+        ),
+    ]
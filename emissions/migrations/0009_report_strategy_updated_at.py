@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-14 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emissions', '0008_source_stored_annual_emission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reductionstrategy',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,11 +1,79 @@
-from datetime import datetime
 from decimal import Decimal
+from collections import Counter, namedtuple
+from functools import lru_cache
+from itertools import chain
+from django.core.cache import cache
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Sum, F
-from django.db.models.functions import Least
+from django.db.models import Sum, F, Q, Case, When, Value, ExpressionWrapper, Prefetch
+from django.db.models.functions import Cast, ExtractYear, Greatest, Least, Now
+from django.utils import timezone
+from django.utils.functional import cached_property
 import numpy as np
+from .utils import MOD_TYPE_CODES, MOD_VALUE, apply_modification_factors
+
+def _current_year():
+    """
+    Default for year fields, evaluated when a row is created rather than when the module is imported.
+    """
+    return timezone.now().year
+
+def _years_active(current_year):
+    """
+    SQL expression for the number of years a source has been active up to current_year,
+    capped at its lifetime. current_year can be an int or a database expression.
+    """
+    return Greatest(Value(0), Least(F('lifetime'), current_year - F('acquisition_year') + 1))
+
+def _annual_emission():
+    """
+    SQL expression for emission_factor * value * quantity evaluated in double precision.
+    The columns stay DecimalField for storage, but aggregations do not need Decimal arithmetic.
+    """
+    return (
+        Cast('emission_factor', models.FloatField())
+        * Cast('value', models.FloatField())
+        * Cast('quantity', models.FloatField())
+    )
+
+def _stored_annual_emission():
+    """
+    Column holding emission_factor * value * quantity, computed by the database when a row is written.
+    Use it in queries instead of _annual_emission so reads do not recompute the product.
+    """
+    return F('stored_annual_emission')
+
+def _emissions_in_year(year):
+    """
+    Aggregate summing the annual emission of the sources active in the given year.
+    Several of these can be combined in one aggregate() call to get many years in one query.
+    """
+    active = Q(acquisition_year__lte=year) & Q(acquisition_year__gt=year - F('lifetime'))
+    return Sum(Case(
+        When(active, then=_stored_annual_emission()),
+        default=Value(0.0),
+        output_field=models.FloatField()
+    ))
+
+# Seconds a projected total emissions result stays cached, see Report.cached_projected_total_emissions
+PROJECTED_EMISSIONS_CACHE_TIMEOUT = 3600
+
+# Number of sources processed per block in projections, sized to keep the working set in L2 cache
+PROJECTION_TILE_SIZE = 16384
+
+class ReportQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for loading reports together with their related rows.
+    """
+    def for_serializer(self):
+        """
+        Load only the columns exposed by ReportSerializer, with the nested strategies prefetched
+        in a single query. Sources are not needed to serialize reports, the total comes from the cache column.
+        """
+        return self.only('id', 'name', 'date', 'total_emissions_cache').prefetch_related(
+            Prefetch('reduction_strategies', queryset=ReductionStrategy.objects.only('id', 'name', 'created_at'))
+        )
 
 class Report(models.Model):
     """
@@ -16,7 +84,10 @@ class Report(models.Model):
     date = models.DateField()
     reduction_strategies = models.ManyToManyField('ReductionStrategy', related_name='reports')
     total_emissions_cache = models.FloatField(null=True)  # New field for caching
+    # Bumped whenever the report or the emissions of its sources change, see update_total_emissions
+    updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ReportQuerySet.as_manager()
 
     class Meta:
         unique_together = ['name', 'date']
@@ -28,33 +99,24 @@ class Report(models.Model):
     def total_emissions(self, year=None):
         """
         Calculate total emissions for the report, optionally for a specific year.
+        Runs as a single aggregate query so no Source instances are built, see SourceQuerySet.total_emissions.
         """
-        sources = self.sources.all()
-
-        if year is None:
-            return sources.aggregate(
-                total=Sum(
-                    F('emission_factor') * F('value') * F('quantity') *
-                    Least(F('lifetime'), models.functions.ExtractYear(models.functions.Now()) - F('acquisition_year') + 1)
-                )
-            )['total'] or Decimal('0.00')
-
-        return sources.filter(
-            acquisition_year__lte=year,
-            acquisition_year__gt=year - F('lifetime')
-        ).aggregate(
-            total=Sum(F('emission_factor') * F('value') * F('quantity'))
-        )['total'] or Decimal('0.00')
+        return self.sources.total_emissions(year)
 
     def compare_emissions(self, year1, year2):
         """
         Compare emissions between two years.
         Returns a dictionary with emission values and percentage change.
+        Both years are aggregated in a single query.
         """
-        emissions1 = self.total_emissions(year1)
-        emissions2 = self.total_emissions(year2)
+        totals = self.sources.aggregate(
+            emissions1=_emissions_in_year(year1),
+            emissions2=_emissions_in_year(year2)
+        )
+        emissions1 = float(totals['emissions1'] or 0.0)
+        emissions2 = float(totals['emissions2'] or 0.0)
         difference = emissions2 - emissions1
-        percentage_change = ((difference / emissions1) * 100) if emissions1 else Decimal('0.00')
+        percentage_change = ((difference / emissions1) * 100) if emissions1 else 0.0
         return {
             'year1': year1,
             'year2': year2,
@@ -67,39 +129,115 @@ class Report(models.Model):
     def projected_total_emissions(self, year, reduction_strategies=None):
         """
         Calculate projected total emissions for a given year, optionally applying reduction strategies.
-        Uses numpy for efficient calculations and prefetch_related for optimized database queries.
+        Sources and modifications are each loaded with a single values_list query and the
+        calculation is vectorized with numpy.
         """
-        sources = self.sources.all().prefetch_related('modifications')
-        
-        # Create arrays for vectorized calculations
-        emission_factors = np.array([source.emission_factor for source in sources])
-        values = np.array([source.value for source in sources])
-        quantities = np.array([source.quantity for source in sources])
-        acquisition_years = np.array([source.acquisition_year for source in sources])
-        lifetimes = np.array([source.lifetime for source in sources])
+        ids, emission_factors, values, quantities, acquisition_years, lifetimes = self.sources.columns(
+            'id', 'emission_factor', 'value', 'quantity', 'acquisition_year', 'lifetime'
+        )
 
-        # Calculate base emissions
-        active_mask = (acquisition_years <= year) & (year < acquisition_years + lifetimes)
-        base_emissions = np.where(active_mask, emission_factors * values * quantities, 0)
+        # Fused active-mask and base product, summed per tile so each block stays in cache.
+        # The product is multiplied into one tile buffer, and the dot with the mask sums the active sources.
+        total = 0.0
+        base = np.empty(min(ids.size, PROJECTION_TILE_SIZE))
+        for start in range(0, ids.size, PROJECTION_TILE_SIZE):
+            block = slice(start, start + PROJECTION_TILE_SIZE)
+            acquired = acquisition_years[block]
+            tile = base[:acquired.size]
+            np.multiply(emission_factors[block], values[block], out=tile)
+            tile *= quantities[block]
+            total += float(np.dot(tile, (acquired <= year) & (year < acquired + lifetimes[block])))
 
         if reduction_strategies:
-            for strategy in reduction_strategies:
-                modifications = strategy.modifications.filter(start_year__lte=year)
-                for mod in modifications:
-                    mod_mask = active_mask & (mod.source.id == np.array([s.id for s in sources]))
-                    if mod.modification_type == 'VALUE':
-                        base_emissions[mod_mask] *= float(mod.value)
-                    elif mod.modification_type == 'EF':
-                        base_emissions[mod_mask] *= (float(mod.value) / emission_factors[mod_mask])
-
-        return Decimal(str(np.sum(base_emissions)))
+            modifications = list(Modification.objects.filter(
+                reduction_strategy__in=reduction_strategies,
+                source__report=self,
+                start_year__lte=year
+            ).values_list('source_id', 'modification_type', 'value', 'is_progressive', 'target_value', 'start_year', 'end_year'))
+
+            if modifications:
+                source_ids, modification_types, mod_values, is_progressive, target_values, start_years, end_years = zip(*modifications)
+                # Position of each modified source in the columns, looked up for all modifications at once
+                sorter = np.argsort(ids)
+                mod_idx = sorter[np.searchsorted(ids, source_ids, sorter=sorter)]
+                mod_types = np.fromiter(
+                    (MOD_TYPE_CODES.get(modification_type, -1) for modification_type in modification_types),
+                    dtype=np.int8, count=len(modifications)
+                )
+                mod_values = np.array(mod_values, dtype=np.float64)
+
+                # Progressive modifications move the source value towards the target along the
+                # progression curve, which becomes a plain VALUE multiplier for this year.
+                # Missing end years and targets become NaN and leave the modification as is.
+                target_values = np.array(target_values, dtype=np.float64)
+                start_years = np.array(start_years, dtype=np.float64)
+                end_years = np.array(end_years, dtype=np.float64)
+                progressive = (
+                    (mod_types == MOD_VALUE) & np.array(is_progressive, dtype=bool)
+                    & ~np.isnan(end_years) & ~np.isnan(target_values)
+                )
+                if progressive.any():
+                    spans = end_years[progressive] - start_years[progressive] + 1
+                    progress = (np.minimum(year - start_years[progressive], spans - 1) + 1) / spans
+                    source_values = values[mod_idx[progressive]]
+                    mod_values[progressive] = (
+                        source_values + (target_values[progressive] - source_values) * progress
+                    ) / source_values
+
+                # Only the modified sources are recomputed, their change is added to the base total
+                known = mod_types >= 0
+                touched, local_idx = np.unique(mod_idx[known], return_inverse=True)
+                touched_active = (acquisition_years[touched] <= year) & (year < acquisition_years[touched] + lifetimes[touched])
+                touched_emissions = np.where(
+                    touched_active, emission_factors[touched] * values[touched] * quantities[touched], 0.0
+                )
+                unmodified = float(np.sum(touched_emissions))
+                apply_modification_factors(
+                    touched_emissions, touched_active, local_idx, mod_types[known], mod_values[known],
+                    values[touched], quantities[touched]
+                )
+                total += float(np.sum(touched_emissions)) - unmodified
+
+        return Decimal(str(total))
     
+    def projected_emissions_cache_key(self, year, strategy_versions=None):
+        """
+        Cache key of a projected total emissions result.
+        The projection only depends on the report's sources and the modifications of the applied
+        strategies, whose changes bump the updated_at of the report and of the strategies.
+        Both are part of the key, so a stale result is never hit and no invalidation is needed.
+
+        :param strategy_versions: Dict of the applied strategies' updated_at by ID
+        """
+        strategy_part = ','.join(
+            f"{pk}@{updated_at.timestamp()}"
+            for pk, updated_at in sorted((strategy_versions or {}).items())
+        )
+        return f"projected-emissions:{self.pk}@{self.updated_at.timestamp()}:{year}:{strategy_part}"
+
+    def cached_projected_total_emissions(self, year, strategy_versions=None):
+        """
+        projected_total_emissions, memoized in the Django cache, see projected_emissions_cache_key.
+
+        :param strategy_versions: Dict of the applied strategies' updated_at by ID
+        """
+        key = self.projected_emissions_cache_key(year, strategy_versions)
+        projected = cache.get(key)
+        if projected is None:
+            projected = self.projected_total_emissions(year, list(strategy_versions or []))
+            cache.set(key, projected, PROJECTED_EMISSIONS_CACHE_TIMEOUT)
+        return projected
+
     def update_total_emissions(self):
         """
         Update the cached total emissions value.
+        Writes only the cache and updated_at columns with a single UPDATE, without a full model save.
         """
         self.total_emissions_cache = self.total_emissions()
-        self.save()
+        self.updated_at = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(
+            total_emissions_cache=self.total_emissions_cache, updated_at=self.updated_at
+        )
 
     def get_total_emissions(self):
         """
@@ -109,6 +247,101 @@ class Report(models.Model):
             self.update_total_emissions()
         return self.total_emissions_cache
 
+@lru_cache(maxsize=None)
+def _source_columns(fields):
+    """
+    Named tuple type of the columns returned by SourceQuerySet.columns, created once per set of fields.
+    """
+    return namedtuple('SourceColumns', fields)
+
+class SourceQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for Source.
+    """
+    def with_emissions(self):
+        """
+        Annotate annual_emission and total_emission so the database computes them.
+        The annotations fill the attributes of the matching Source properties.
+        """
+        return self.annotate(
+            annual_emission=_stored_annual_emission()
+        ).annotate(
+            total_emission=ExpressionWrapper(
+                F('annual_emission') * _years_active(ExtractYear(Now())), output_field=models.FloatField()
+            )
+        )
+
+    def total_emissions(self, year=None):
+        """
+        Total emissions of the sources in the queryset, optionally for a specific year.
+        Runs as a single aggregate query whatever the number of reports the sources belong to.
+        """
+        annual_emission = _stored_annual_emission()
+
+        if year is None:
+            current_year = timezone.now().year
+            total = self.aggregate(
+                total=Sum(ExpressionWrapper(annual_emission * _years_active(current_year), output_field=models.FloatField()))
+            )['total']
+        else:
+            total = self.filter(acquisition_year__lte=year).annotate(
+                end_year=F('acquisition_year') + F('lifetime')
+            ).filter(end_year__gt=year).aggregate(
+                total=Sum(ExpressionWrapper(annual_emission, output_field=models.FloatField()))
+            )['total']
+
+        return float(total or 0.0)
+
+    def columns(self, *fields):
+        """
+        Read the given numeric fields of all sources with one values_list query,
+        as float64 column arrays in the order of the fields.
+        The rows are flattened straight into a single array, without an intermediate list per column.
+        The columns come as a SourceColumns named tuple: unpacked in order or read by field name.
+        """
+        rows = self.values_list(*fields)
+        flat = np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=len(rows) * len(fields))
+        return _source_columns(fields)(*flat.reshape(-1, len(fields)).T)
+
+    def bulk_create_sources(self, sources, batch_size=500):
+        """
+        Validate and insert many sources with a single bulk INSERT per batch.
+        Field and model validation runs in Python for every source. Instead of the per-row
+        queries of full_clean, the reports are loaded with one in_bulk query and the names are
+        checked against the batch and the existing sources with one query.
+        The totals of the affected reports are recalculated once, after the transaction commits.
+        :param sources: Iterable of unsaved Source instances
+        :param batch_size: Number of rows per INSERT statement
+        :return: The list of created sources
+        """
+        from .signals import mark_report_dirty
+
+        sources = list(sources)
+        reports = Report.objects.in_bulk({source.report_id for source in sources})
+        names = Counter(source.name for source in sources)
+        taken = set(self.filter(name__in=names).values_list('name', flat=True))
+
+        errors = {}
+        for index, source in enumerate(sources):
+            try:
+                source.full_clean(exclude=['report'], validate_unique=False, validate_constraints=False)
+            except ValidationError as e:
+                for field, messages in e.message_dict.items():
+                    errors[f'{index}.{field}'] = messages
+            if source.report_id in reports:
+                source.report = reports[source.report_id]
+            else:
+                errors[f'{index}.report'] = [f'Report {source.report_id} does not exist.']
+            if names[source.name] > 1 or source.name in taken:
+                errors.setdefault(f'{index}.name', []).append('Source with this Name already exists.')
+        if errors:
+            raise ValidationError(errors)
+
+        created = self.bulk_create(sources, batch_size=batch_size)
+        for report_id in {source.report_id for source in created}:
+            mark_report_dirty(report_id)
+        return created
+
 class Source(models.Model):
     """
     A Source represents an emission source that generates greenhouse gases (GHG).
@@ -168,9 +401,27 @@ class Source(models.Model):
         help_text="Specific year for this source's data. If set, emissions are only calculated for this year. "
                     "If null, the source is considered active from acquisition_year to acquisition_year + lifetime."
     )
+    # Annual emission kept up to date by the database, so aggregates read a column instead of
+    # multiplying three columns per row. total_emission depends on the current year and
+    # cannot be a generated column, it is derived from this one in SourceQuerySet.with_emissions.
+    stored_annual_emission = models.GeneratedField(
+        expression=_annual_emission(),
+        output_field=models.FloatField(),
+        db_persist=True,
+    )
+
+    objects = SourceQuerySet.as_manager()
+
+    # Fields that take part in the emission calculations, by attribute name
+    EMISSION_FIELDS = ('report_id', 'emission_factor', 'value', 'quantity', 'lifetime', 'acquisition_year', 'year')
 
     class Meta:
         unique_together = ['name', 'report', 'year']
+        # Report-wide aggregates filter on the acquisition year or the year-specific data
+        indexes = [
+            models.Index(fields=['report', 'acquisition_year']),
+            models.Index(fields=['report', 'year']),
+        ]
 
     def __str__(self):
         return self.name
@@ -184,39 +435,116 @@ class Source(models.Model):
         if self.year and (self.year < self.acquisition_year or self.year >= self.acquisition_year + self.lifetime):
             raise ValidationError({'year': 'Year must be within the source\'s lifetime.'})
         
-    def save(self, *args, **kwargs):
-        self.full_clean()
+    def save(self, *args, validate=True, **kwargs):
+        """
+        Save the source, running full_clean first unless validate is False.
+        Use validate=False only when the instance was already validated, e.g. by bulk_create_sources.
+        """
+        if validate:
+            self.full_clean()
         super().save(*args, **kwargs)
+        self.clear_emission_cache()
+        self._snapshot_emission_fields()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_emission_fields()
+        return instance
+
+    def _snapshot_emission_fields(self):
+        """
+        Remember the stored values of the emission fields, see emission_fields_changed.
+        Deferred fields are not loaded and are left out of the snapshot.
+        """
+        self._stored_emission_fields = {
+            field: self.__dict__[field] for field in self.EMISSION_FIELDS if field in self.__dict__
+        }
+
+    def emission_fields_changed(self):
+        """
+        Return True if any field used by the emission calculations differs from the stored row.
+        Instances that were never saved or loaded always count as changed.
+        """
+        stored = getattr(self, '_stored_emission_fields', None)
+        if stored is None:
+            return True
+        return any(
+            self.__dict__.get(field, models.DEFERRED) != stored.get(field, models.DEFERRED)
+            for field in self.EMISSION_FIELDS
+        )
+
+    @property
+    def stored_report_id(self):
+        """
+        The report this source belonged to when it was last saved or loaded.
+        """
+        return getattr(self, '_stored_emission_fields', {}).get('report_id', self.report_id)
 
     def calculate_emission_for_year(self, year):
         """
         Calculate the emission for a specific year.
         Returns 0 if the source is not active in the given year.
+        Results are cached per year on the instance, see clear_emission_cache.
         """
-        if self.year and self.year != year:
-            return Decimal('0.00')
-        if year < self.acquisition_year or year >= self.acquisition_year + self.lifetime:
-            return Decimal('0.00')
-        return self.annual_emission
+        emission_by_year = self.__dict__.setdefault('_emission_by_year', {})
+        if year not in emission_by_year:
+            if self.year and self.year != year:
+                emission_by_year[year] = Decimal('0.00')
+            elif year < self.acquisition_year or year >= self.acquisition_year + self.lifetime:
+                emission_by_year[year] = Decimal('0.00')
+            else:
+                emission_by_year[year] = self.annual_emission
+        return emission_by_year[year]
 
-    @property
+    def calculate_total_emission(self, current_year):
+        """
+        Calculate the total emission over the lifetime of the source up to current_year.
+        Caps the calculation at the source's lifetime.
+        """
+        years_active = max(0, min(current_year - self.acquisition_year + 1, self.lifetime))
+        return self.annual_emission * years_active
+
+    @cached_property
     def total_emission(self):
         """
         Calculate the total emission over the lifetime of the source.
         Considers the current year and caps the calculation at the source's lifetime.
+        Cached on the instance, see clear_emission_cache.
         """
-        from django.utils import timezone
-        current_year = timezone.now().year
-        years_active = max(0, min(current_year - self.acquisition_year + 1, self.lifetime))
-        return self.emission_factor * self.value * self.quantity * years_active
+        return self.calculate_total_emission(timezone.now().year)
 
-    @property
+    @cached_property
     def annual_emission(self):
         """
         Calculate the annual emission for this source.
+        Cached on the instance, see clear_emission_cache.
         """
         return self.emission_factor * self.value * self.quantity
 
+    def clear_emission_cache(self):
+        """
+        Drop the cached emission values so they are recomputed from the current fields.
+        """
+        self.__dict__.pop('total_emission', None)
+        self.__dict__.pop('annual_emission', None)
+        self.__dict__.pop('_emission_by_year', None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.clear_emission_cache()
+        self._snapshot_emission_fields()
+
+class ReductionStrategyQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for ReductionStrategy.
+    """
+    def touch(self):
+        """
+        Bump updated_at of the strategies, e.g. after their modifications changed.
+        """
+        return self.update(updated_at=timezone.now())
+
 class ReductionStrategy(models.Model):
     """
     A reduction strategy for reducing emissions.
@@ -224,10 +552,69 @@ class ReductionStrategy(models.Model):
     """
     name = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped whenever the strategy or one of its modifications changes
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ReductionStrategyQuerySet.as_manager()
 
     def __str__(self):
         return self.name
 
+class ModificationQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for Modification.
+    """
+    def with_source(self):
+        """
+        Join the source row so calculations reading modification.source do not query it per modification.
+        """
+        return self.select_related('source')
+
+    def bulk_create_with_order(self, modifications, batch_size=500):
+        """
+        Insert many modifications with bulk_create, assigning the missing orders like save() does.
+        The current maximum order of every (reduction_strategy, source, start_year) group is
+        fetched with a single grouped query instead of one query per modification.
+        :param modifications: Iterable of unsaved Modification instances
+        :param batch_size: Number of rows per INSERT statement
+        :return: The list of created modifications
+        """
+        modifications = list(modifications)
+
+        def group_key(modification):
+            return (modification.reduction_strategy_id, modification.source_id, modification.start_year)
+
+        groups = {group_key(modification) for modification in modifications if not modification.order}
+        if groups:
+            condition = Q()
+            for strategy_id, source_id, start_year in groups:
+                condition |= Q(reduction_strategy_id=strategy_id, source_id=source_id, start_year=start_year)
+            last_orders = {
+                (row['reduction_strategy'], row['source'], row['start_year']): row['max_order']
+                for row in self.filter(condition).order_by().values(
+                    'reduction_strategy', 'source', 'start_year'
+                ).annotate(max_order=models.Max('order'))
+            }
+
+            # Orders given explicitly in the batch count towards the group's maximum as well
+            for modification in modifications:
+                key = group_key(modification)
+                if modification.order and key in groups:
+                    last_orders[key] = max(last_orders.get(key) or 0, modification.order)
+
+            for modification in modifications:
+                if not modification.order:
+                    key = group_key(modification)
+                    modification.order = (last_orders.get(key) or 0) + 1
+                    last_orders[key] = modification.order
+
+        created = self.bulk_create(modifications, batch_size=batch_size)
+        # bulk_create sends no post_save signals, bump the strategies here
+        ReductionStrategy.objects.filter(
+            pk__in={modification.reduction_strategy_id for modification in created}
+        ).touch()
+        return created
+
 class Modification(models.Model):
     """
     A modification applied to a source as part of a reduction strategy.
@@ -251,8 +638,10 @@ class Modification(models.Model):
     # ---- Fields that were previously in ModifiedEmission ----
     calculation_year = models.PositiveSmallIntegerField(
         help_text="Specific year for which this modification is calculated",
-        default=datetime.now().year
+        default=_current_year
         )
+
+    objects = ModificationQuerySet.as_manager()
     # Calculated fields now so commenting these just in case I need to time travel 😅
     """ modified_value = models.FloatField(help_text="Modified emission value for this year")
     modified_emission_factor = models.FloatField(help_text="Modified emission factor for this year")
@@ -270,9 +659,10 @@ class Modification(models.Model):
         Custom save method to automatically set the order if not provided.
         """
         if not self.order:
+            # The raw foreign key columns, so the related rows are not loaded just for their IDs
             last_order = Modification.objects.filter(
-                reduction_strategy=self.reduction_strategy,
-                source=self.source,
+                reduction_strategy_id=self.reduction_strategy_id,
+                source_id=self.source_id,
                 start_year=self.start_year
             ).aggregate(models.Max('order'))['order__max'] or 0
             self.order = last_order + 1
@@ -302,6 +692,76 @@ class Modification(models.Model):
         else:
             raise ValidationError(f"Unknown modification type: {self.modification_type}")
 
+    # Columns loaded by bulk_calculate_modified_emissions, null values are stored as NaN
+    _BULK_DTYPE = [
+        ('id', 'i8'), ('source_id', 'i8'), ('modification_type', 'U5'), ('value', 'f8'),
+        ('is_progressive', '?'), ('target_value', 'f8'), ('start_year', 'f8'), ('end_year', 'f8'),
+        ('calculation_year', 'f8'), ('source_emission_factor', 'f8'), ('source_value', 'f8'),
+        ('source_quantity', 'f8'), ('source_acquisition_year', 'f8'), ('source_lifetime', 'f8'),
+        ('source_year', 'f8'),
+    ]
+
+    @classmethod
+    def bulk_calculate_modified_emissions(cls, modifications, base_emissions_by_source_id=None):
+        """
+        Vectorized equivalent of calculate_modified_emission for many modifications at once.
+        The modification and source columns are loaded with a single values_list query into a
+        numpy structured array, so no Modification or Source instance is built.
+        :param modifications: QuerySet of Modification objects
+        :param base_emissions_by_source_id: Optional mapping of source ID to the base emission to modify.
+            When omitted, each source's emission for the modification's calculation_year is used.
+        :return: Dictionary of modified emissions keyed by modification ID
+        """
+        rows = [
+            tuple(np.nan if value is None else value for value in row)
+            for row in modifications.values_list(
+                'id', 'source_id', 'modification_type', 'value', 'is_progressive', 'target_value',
+                'start_year', 'end_year', 'calculation_year', 'source__emission_factor', 'source__value',
+                'source__quantity', 'source__acquisition_year', 'source__lifetime', 'source__year'
+            )
+        ]
+        mods = np.array(rows, dtype=cls._BULK_DTYPE)
+        if not mods.size:
+            return {}
+
+        unknown = ~np.isin(mods['modification_type'], ['VALUE', 'EF'])
+        if unknown.any():
+            raise ValidationError(f"Unknown modification type: {mods['modification_type'][unknown][0]}")
+        progressive = mods['is_progressive'] & (mods['modification_type'] == 'VALUE')
+        if np.isnan(mods['end_year'][progressive]).any() or np.isnan(mods['target_value'][progressive]).any():
+            raise ValidationError("Progressive modifications require an end_year and a target_value")
+
+        if base_emissions_by_source_id is None:
+            calc_year = mods['calculation_year']
+            active = (
+                (np.isnan(mods['source_year']) | (mods['source_year'] == calc_year))
+                & (mods['source_acquisition_year'] <= calc_year)
+                & (calc_year < mods['source_acquisition_year'] + mods['source_lifetime'])
+            )
+            base = np.where(
+                active,
+                mods['source_emission_factor'] * mods['source_value'] * mods['source_quantity'],
+                0.0
+            )
+        else:
+            base = np.array([float(base_emissions_by_source_id[sid]) for sid in mods['source_id']], dtype=np.float64)
+
+        # Progressive VALUE modifications move linearly from the source value to the target value
+        total_years = mods['end_year'] - mods['start_year'] + 1
+        years_passed = np.minimum(mods['calculation_year'] - mods['start_year'] + 1, total_years)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            progress = years_passed / total_years
+            current_value = mods['source_value'] + (mods['target_value'] - mods['source_value']) * progress
+            progressive_factor = current_value / mods['source_value']
+            ef_factor = mods['value'] / mods['source_emission_factor']
+
+        factor = np.where(
+            mods['modification_type'] == 'EF',
+            ef_factor,
+            np.where(progressive, progressive_factor, mods['value'])
+        )
+        return dict(zip(mods['id'].tolist(), (base * factor).tolist()))
+
     def get_modified_emission(self):
         """
         Get the modified emission value, calculating it if necessary.
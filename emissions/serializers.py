@@ -1,10 +1,20 @@
+from functools import lru_cache
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Report, Source, ReductionStrategy, Modification
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _detail_path_prefix(view_name):
+    '''
+    Return the path of a detail view without its primary key, e.g. '/api/sources/'.
+    The URL table is static, so each view name is reversed once per process.
+    '''
+    return reverse(view_name, args=[0])[:-len('0/')]
+
 class ReductionStrategySerializer(serializers.HyperlinkedModelSerializer):
     '''
     Serializer for the ReductionStrategy model.
@@ -78,6 +88,20 @@ class SourceSerializer(serializers.HyperlinkedModelSerializer):
             logger.error(f"Error creating source: {str(e)}")
             raise
 
+class SourceBulkSerializer(SourceSerializer):
+    '''
+    Serializer for the rows of a bulk source creation.
+    The report is read as a plain ID and the name has no per-row uniqueness check:
+    Source.objects.bulk_create_sources checks both for the whole batch, with one query each.
+    '''
+    report = serializers.IntegerField(source='report_id')
+
+    class Meta(SourceSerializer.Meta):
+        extra_kwargs = {
+            **SourceSerializer.Meta.extra_kwargs,
+            'name': {'validators': []}
+        }
+
 class ModificationSerializer(serializers.HyperlinkedModelSerializer):
     '''
     Serializer for the Modification model.
@@ -114,14 +138,18 @@ class ModificationSerializer(serializers.HyperlinkedModelSerializer):
         request = self.context.get('request')
 
         if request:
+            # Scheme and host are resolved once and shared by every item of a list payload
+            if '_absolute_root' not in self.context:
+                self.context['_absolute_root'] = request.build_absolute_uri('/')[:-1]
+            absolute_root = self.context['_absolute_root']
+
             for field in ['reduction_strategy', 'source']:
                 if field in data:
                     value = data[field]
                     if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
                         # If it's an ID, convert it to a URL
                         url_name = 'reductionstrategy-detail' if field == 'reduction_strategy' else 'source-detail'
-                        url = reverse(url_name, args=[value])
-                        data[field] = request.build_absolute_uri(url)
+                        data[field] = f"{absolute_root}{_detail_path_prefix(url_name)}{value}/"
                     elif isinstance(value, str) and not value.startswith('http'):
                         # If it's a string but not a URL, assume it's a relative URL and make it absolute
                         data[field] = request.build_absolute_uri(value)
@@ -133,4 +161,18 @@ class ModificationSerializer(serializers.HyperlinkedModelSerializer):
         Create and return a new Modification instance, given the validated data.
         '''
         logger.debug(f"Creating modification with data: {validated_data}")
-        return super().create(validated_data)
\ No newline at end of file
+        return super().create(validated_data)
+
+class ProjectionQuerySerializer(serializers.Serializer):
+    '''
+    Serializer validating the query parameters of the projected emissions endpoint.
+    Repeated strategies parameters are read as a list of IDs.
+    '''
+    year = serializers.IntegerField(required=False, min_value=1900)
+    strategies = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate_year(self, value):
+        max_year = timezone.now().year + 100
+        if value > max_year:
+            raise serializers.ValidationError(f"Year must be between 1900 and {max_year}")
+        return value
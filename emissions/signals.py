@@ -1,3 +1,4 @@
+from django.db import connection, transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
@@ -7,20 +8,66 @@ Signals allow certain senders to notify a set of receivers that some action has
 They're especially useful for decoupling applications and maintaining data integrity.
 '''
 
+def mark_report_dirty(report_id):
+    '''
+    Flag a report whose total emissions need recalculating and schedule the flush.
+
+    Report IDs are collected on the database connection so that saving or deleting
+    many sources of the same report inside one transaction only recalculates it once,
+    after the transaction commits. Outside of a transaction the flush runs immediately.
+
+    :param report_id: The primary key of the Report to recalculate
+    '''
+    if not hasattr(connection, '_dirty_reports'):
+        connection._dirty_reports = set()
+    connection._dirty_reports.add(report_id)
+    transaction.on_commit(_flush_dirty_reports)
+
+def _flush_dirty_reports():
+    '''
+    Recalculate the cached total emissions of every report flagged as dirty.
+
+    The pending set is swapped out before recalculating, so the additional callbacks
+    scheduled for the same transaction find nothing left to do.
+    '''
+    from .models import Report
+
+    report_ids = getattr(connection, '_dirty_reports', set())
+    connection._dirty_reports = set()
+    if not report_ids:
+        return
+    for report in Report.objects.filter(pk__in=report_ids):
+        report.update_total_emissions()
+
+# Names accepted in save(update_fields=...) for the fields used by the emission calculations
+_EMISSION_UPDATE_FIELDS = frozenset({
+    'report', 'report_id', 'emission_factor', 'value', 'quantity', 'lifetime', 'acquisition_year', 'year'
+})
+
 @receiver(post_save, sender='emissions.Source')
 def update_report_emissions(sender, instance, **kwargs):
     '''
     Signal handler to update report emissions when a Source is saved.
 
     This function is called automatically after a Source instance is saved.
-    It ensures that the total emissions for the associated Report are recalculated.
+    It ensures that the total emissions for the associated Report are recalculated
+    once the current transaction commits. Saves that don't touch any of the fields
+    used by the emission calculations (name, description, uncertainty...) are skipped.
 
     :param sender: The model class that sent the signal (Source in this case)
     :param instance: The actual instance of the Source that was saved
     :param kwargs: Additional keyword arguments
     '''
-    # Call the update_total_emissions method on the report associated with this source
-    instance.report.update_total_emissions()
+    update_fields = kwargs.get('update_fields')
+    if not kwargs.get('created'):
+        if update_fields is not None and update_fields.isdisjoint(_EMISSION_UPDATE_FIELDS):
+            return
+        if not instance.emission_fields_changed():
+            return
+        # A source moved to another report changes the totals of both reports
+        if instance.stored_report_id != instance.report_id:
+            mark_report_dirty(instance.stored_report_id)
+    mark_report_dirty(instance.report_id)
 
 @receiver(post_delete, sender='emissions.Source')
 def update_report_emissions_on_delete(sender, instance, **kwargs):
@@ -28,18 +75,37 @@ def update_report_emissions_on_delete(sender, instance, **kwargs):
     Signal handler to update report emissions when a Source is deleted.
 
     This function is called automatically after a Source instance is deleted.
-    It ensures that the total emissions for the associated Report are recalculated.
+    It ensures that the total emissions for the associated Report are recalculated
+    once the current transaction commits.
 
     :param sender: The model class that sent the signal (Source in this case)
     :param instance: The actual instance of the Source that was deleted
     :param kwargs: Additional keyword arguments
     '''
-    # Call the update_total_emissions method on the report associated with this source
-    instance.report.update_total_emissions()
+    mark_report_dirty(instance.report_id)
+
+@receiver(post_save, sender='emissions.Modification')
+@receiver(post_delete, sender='emissions.Modification')
+def touch_reduction_strategy(sender, instance, **kwargs):
+    '''
+    Signal handler to bump the updated_at of a ReductionStrategy when one of its Modifications
+    is saved or deleted, so the cached projections using the strategy are no longer hit.
+
+    :param sender: The model class that sent the signal (Modification in this case)
+    :param instance: The actual instance of the Modification that was saved or deleted
+    :param kwargs: Additional keyword arguments
+    '''
+    from .models import ReductionStrategy
+
+    ReductionStrategy.objects.filter(pk=instance.reduction_strategy_id).touch()
 
 '''
 Note: These signals help maintain data consistency by automatically updating
 the total emissions of a Report whenever a Source is added, modified, or deleted.
 This way, we don't have to remember to manually update the Report's emissions
 every time we make changes to its Sources.
-'''
\ No newline at end of file
+
+Updates are deferred with transaction.on_commit and deduplicated per report, so a
+bulk import of many sources triggers a single recalculation per report instead of
+one per source.
+'''
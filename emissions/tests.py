@@ -1,27 +1,131 @@
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
+import cProfile
+import csv
+import gc
+import io
+import os
+import pstats
 import timeit
-from django.test import TestCase
+from unittest import skipUnless
+from unittest.mock import patch
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from emissions.models import Report, Source, ReductionStrategy, Modification
-from emissions.views import calculate_total_reduction
+from emissions.serializers import ReportSerializer, SourceSerializer
+from emissions.views import SourceList, calculate_total_reduction
 from django.db.models.signals import post_save, post_delete
 import logging
 from decimal import Decimal
+import json
 from emissions.views import calculate_emissions_for_years, apply_modifications, calculate_total_reduction
+from emissions.utils import emissions_by_year
+from emissions.signals import update_report_emissions, update_report_emissions_on_delete
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _url(name, *args):
+    '''
+    Reverse a URL name once, the URL table doesn't change during a test run.
+    '''
+    return reverse(name, args=args or None)
+
+def _streamed_json(response):
+    '''
+    Decode the body of a streamed JSON list response.
+    The queries of a streamed list run while its content is consumed.
+    '''
+    return json.loads(b''.join(response.streaming_content))
+
+def _post_json(client, url, data):
+    '''
+    POST a pre-serialized JSON body, with explicit content type and Accept headers
+    so neither the parser nor the renderer has to be negotiated.
+    '''
+    return client.post(url, json.dumps(data), content_type='application/json', HTTP_ACCEPT='application/json')
+
+# Shared by the read-only API tests, the client holds no state between their requests
+_client = APIClient()
+
+# Read the clock once, so every test and fixture of a run agrees on the current date
+TODAY = datetime.now().date()
+CURRENT_YEAR = TODAY.year
+
+# Decimal constants shared by the expected values of the progressive modification tests
+_ONE = Decimal('1')
+_ONE_THIRD = Decimal('1') / Decimal('3')
+_TWO_THIRDS = Decimal('2') / Decimal('3')
+
+@contextmanager
+def signals_muted():
+    '''
+    Disconnect the Source signal handlers for the duration of the block,
+    so the timings only measure the function under test.
+    '''
+    post_save.disconnect(receiver=update_report_emissions, sender=Source)
+    post_delete.disconnect(receiver=update_report_emissions_on_delete, sender=Source)
+    try:
+        yield
+    finally:
+        post_save.connect(update_report_emissions, sender=Source)
+        post_delete.connect(update_report_emissions_on_delete, sender=Source)
+
+def best_of(func, number, repeat=7):
+    '''
+    Time func with timeit.repeat and return the best run, in seconds.
+    One warmup call primes query compilation and caches, and the garbage collector
+    is disabled while timing so its pauses don't end up in the measurement.
+    '''
+    func()
+    gc.disable()
+    try:
+        return min(timeit.repeat(func, number=number, repeat=repeat))
+    finally:
+        gc.enable()
+
+def print_profile(func, number, limit=20):
+    '''
+    Run func number times under cProfile and print the top entries by cumulative time,
+    to tell the NumPy work apart from the ORM and the signal handlers.
+    '''
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(number):
+        func()
+    profiler.disable()
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+    print(stream.getvalue())
+
 # ——————————————————————————————— Performance tests ————————————————————————————
-class PerformanceTestCase(TestCase):
+# The benchmarks are opt-in, see the command at the end of this section
+perf_test = skipUnless(os.environ.get('RUN_PERF') == '1', "Performance tests are opt-in, set RUN_PERF=1")
+
+@perf_test
+class PerformanceTestCase(SimpleTestCase):
+    '''
+    Benchmarks for the calculations that only work on in-memory objects.
+    SimpleTestCase skips the transaction per test and fails loudly if a query slips in.
+    '''
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Input buffers shared by every benchmark of the class
+        cls.EMISSIONS_11 = np.full(11, 100.0)  # 11 years from 2020 to 2030
+        cls.YEARS_2020_2030 = np.arange(2020, 2031)
+
     def setUp(self):
-        # Create test data
-        self.report = Report.objects.create(name="Test Report", date=datetime.now().date())
-        self.source = Source.objects.create(
+        # Unsaved instances, the functions under test never touch the database
+        self.source = Source(
             name="Test Source",
-            report=self.report,
             category="TRANSPORT",
             description="Test description",
             method="DISTANCE",
@@ -34,9 +138,7 @@ class PerformanceTestCase(TestCase):
             uncertainty=5,
             year=None  # Adding this line to take into account the new year field added in v1.1
         )
-        self.strategy = ReductionStrategy.objects.create(name="Test Strategy")
-        self.modification = Modification.objects.create(
-            reduction_strategy=self.strategy,
+        self.modification = Modification(
             source=self.source,
             modification_type="VALUE",
             value=0.9,
@@ -47,27 +149,132 @@ class PerformanceTestCase(TestCase):
         def run_calculation():
             return calculate_emissions_for_years(self.source, 2020, 2030)
         
-        time = timeit.timeit(run_calculation, number=1000)
-        print(f"Time to calculate emissions for years: {time:.6f} seconds")
+        best = best_of(run_calculation, number=200)
+        print(f"Time to calculate emissions for years: best {best:.6f} seconds for 200 runs")
+        print_profile(run_calculation, number=200)
 
     def test_apply_modifications_performance(self):
+        # apply_modifications works in place, so each run gets a fresh copy of the shared emissions
+        modifications = [self.modification]
+
         def run_apply_modifications():
-            emissions = np.array([100.0] * 11)  # 11 years from 2020 to 2030
-            years = np.arange(2020, 2031)
-            return apply_modifications(emissions, self.source, [self.modification], years)
+            return apply_modifications(self.EMISSIONS_11.copy(), self.source, modifications, self.YEARS_2020_2030)
         
-        time = timeit.timeit(run_apply_modifications, number=1000)
-        print(f"Time to apply modifications: {time:.6f} seconds")
+        best = best_of(run_apply_modifications, number=200)
+        print(f"Time to apply modifications: best {best:.6f} seconds for 200 runs")
+        print_profile(run_apply_modifications, number=200)
+
+@perf_test
+class DatabasePerformanceTestCase(TestCase):
+    '''
+    Benchmarks for the calculations that read from the database.
+    '''
+    @classmethod
+    def setUpTestData(cls):
+        # Create test data
+        cls.report = Report.objects.create(name="Test Report", date=TODAY)
+        cls.source = Source.objects.create(
+            name="Test Source",
+            report=cls.report,
+            category="TRANSPORT",
+            description="Test description",
+            method="DISTANCE",
+            emission_factor=0.5,
+            value=1000,
+            value_unit="km",
+            quantity=1,
+            lifetime=5,
+            acquisition_year=2023,
+            uncertainty=5,
+            year=None
+        )
+        cls.strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        cls.modification = Modification.objects.create(
+            reduction_strategy=cls.strategy,
+            source=cls.source,
+            modification_type="VALUE",
+            value=0.9,
+            start_year=2022
+        )
 
     def test_calculate_total_reduction_performance(self):
         def run_total_reduction():
             return calculate_total_reduction(self.strategy, 2020, 2030)
         
-        time = timeit.timeit(run_total_reduction, number=100)
-        print(f"Time to calculate total reduction: {time:.6f} seconds")
+        with signals_muted():
+            best = best_of(run_total_reduction, number=20)
+        print(f"Time to calculate total reduction: best {best:.6f} seconds for 20 runs")
+        print_profile(run_total_reduction, number=20)
+
+        # The number of queries per call should not grow with the number of modifications
+        with CaptureQueriesContext(connection) as ctx:
+            run_total_reduction()
+        print(f"Queries to calculate total reduction: {len(ctx.captured_queries)}")
+
+    def _run_emissions_sweep(self, n_sources, n_years):
+        '''
+        Time calculate_emissions_for_years over n_sources sources and a span of n_years.
+        '''
+        sources = Source.objects.bulk_create_sources(
+            Source(
+                name=f"Sweep Source {n_sources}-{n_years}-{i}",
+                report=self.report,
+                category="TRANSPORT",
+                description="Sweep source",
+                method="DISTANCE",
+                emission_factor=0.5,
+                value=1000,
+                value_unit="km",
+                quantity=1,
+                lifetime=n_years,
+                acquisition_year=2020,
+                uncertainty=5
+            )
+            for i in range(n_sources)
+        )
+        end_year = 2020 + n_years - 1
+
+        def run_calculation():
+            return [calculate_emissions_for_years(source, 2020, end_year) for source in sources]
+
+        # All sources at once, as columns of a single grid
+        years = np.arange(2020, end_year + 1)
+        columns = [np.array(column) for column in zip(*(
+            (float(source.annual_emission), source.acquisition_year, source.lifetime, source.year or 0)
+            for source in sources
+        ))]
+
+        def run_batched_calculation():
+            return emissions_by_year(*columns, years)
+
+        np.testing.assert_allclose(
+            run_batched_calculation(), [list(emissions.values()) for emissions in run_calculation()]
+        )
+        with signals_muted():
+            return best_of(run_calculation, number=1, repeat=3), best_of(run_batched_calculation, number=1, repeat=3)
+
+    def test_calculate_emissions_scaling(self):
+        '''
+        Sweep the number of sources and years to expose how the calculation scales.
+        Results are also written as CSV to perf_runs/ in the project directory.
+        '''
+        results = []
+        for n_years in (11, 51):
+            for n_sources in (1, 10, 100, 1000):
+                best, best_batched = self._run_emissions_sweep(n_sources, n_years)
+                results.append((n_sources, n_years, best, best_batched))
+                print(f"n_sources={n_sources} n_years={n_years}: best {best:.4f} seconds, "
+                      f"batched {best_batched:.4f} seconds")
+
+        output_dir = settings.BASE_DIR / 'perf_runs'
+        output_dir.mkdir(exist_ok=True)
+        with open(output_dir / 'calculate_emissions_scaling.csv', 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['n_sources', 'n_years', 'best_seconds', 'best_batched_seconds'])
+            writer.writerows(results)
 
 # To run the tests:
-# python manage.py test emissions.tests.PerformanceTestCase
+# RUN_PERF=1 python manage.py test emissions.tests.PerformanceTestCase emissions.tests.DatabasePerformanceTestCase
 
 # ——————————————————————————————— Unit tests ————————————————————————————————————
 class SourceModelTest(TestCase):
@@ -75,18 +282,19 @@ class SourceModelTest(TestCase):
     Test cases for the Source model.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the Source model tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
             description="Test description",
             method="DISTANCE",
-            emission_factor=0.1,
+            emission_factor=Decimal('0.1'),
             value=1000,
             value_unit="km",
             quantity=1,
@@ -102,7 +310,7 @@ class SourceModelTest(TestCase):
         '''
         self.assertEqual(self.source.name, "Test Source")
         self.assertEqual(self.source.category, "TRANSPORT")
-        self.assertEqual(self.source.emission_factor, 0.1)
+        self.assertEqual(self.source.emission_factor, Decimal('0.1'))
 
     def test_year_specific_source(self):
         '''
@@ -130,19 +338,9 @@ class SourceModelTest(TestCase):
         '''
         Test the total emission calculation for a source.
         '''
-        current_year = datetime.now().year
-        years_active = min(current_year - self.source.acquisition_year + 1, self.source.lifetime)
+        years_active = min(CURRENT_YEAR - self.source.acquisition_year + 1, self.source.lifetime)
         expected_total_emission = self.source.emission_factor * self.source.value * self.source.quantity * years_active
 
-        # Print debug information
-        print(f"Source details: emission_factor={self.source.emission_factor}, value={self.source.value}, "
-            f"quantity={self.source.quantity}, lifetime={self.source.lifetime}, "
-            f"acquisition_year={self.source.acquisition_year}")
-        print(f"Current year: {current_year}")
-        print(f"Years active: {years_active}")
-        print(f"Calculated total emission: {self.source.total_emission}")
-        print(f"Expected total emission: {expected_total_emission}")
-
         self.assertAlmostEqual(self.source.total_emission, expected_total_emission, places=2)
 
     def test_str_representation(self):
@@ -156,14 +354,15 @@ class ProjectionViewSetTest(APITestCase):
     Test cases for the ProjectionViewSet.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the ProjectionViewSet tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
             description="Test description",
             method="DISTANCE",
@@ -175,11 +374,11 @@ class ProjectionViewSetTest(APITestCase):
             acquisition_year=2023,
             uncertainty=5
         )
-        self.reduction_strategy = ReductionStrategy.objects.create(name="Test Strategy")
-        self.report.reduction_strategies.add(self.reduction_strategy)
-        self.modification = Modification.objects.create(
-            reduction_strategy=self.reduction_strategy,
-            source=self.source,
+        cls.reduction_strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        cls.report.reduction_strategies.add(cls.reduction_strategy)
+        cls.modification = Modification.objects.create(
+            reduction_strategy=cls.reduction_strategy,
+            source=cls.source,
             modification_type="VALUE",
             value=Decimal('0.9'),
             order=1,
@@ -194,14 +393,14 @@ class ProjectionViewSetTest(APITestCase):
         Test the projection of modifications.
         '''
         # 1. Send POST request
-        url = reverse('projection-project-modifications')
+        url = _url('projection-project-modifications')
         data = {
             "source_id": self.source.id,
             "modification_ids": [self.modification.id],
             "start_year": 2023,
             "end_year": 2075  # Test with a year beyond the 50-year limit
         }
-        response = self.client.post(url, data, format='json')
+        response = _post_json(self.client, url, data)
 
         # 2. Check response and verify projections
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -209,18 +408,18 @@ class ProjectionViewSetTest(APITestCase):
         self.assertEqual(response.data['end_year'], 2073)  # Should be capped at 50 years from start
 
         projections = response.data['projections']
-        print(f"Projected emissions: {projections}")  # For debugging
 
         self.assertIn('2023', projections)
-        self.assertAlmostEqual(Decimal(projections['2023']), Decimal('20.0'), places=2)  # Base emission
-        self.assertAlmostEqual(Decimal(projections['2024']), Decimal('18.0'), places=2)  # 10% reduction applied
-        self.assertAlmostEqual(Decimal(projections['2025']), Decimal('18.0'), places=2)  # Should maintain the reduction
-        self.assertAlmostEqual(Decimal(projections['2026']), Decimal('18.0'), places=2)  # Should maintain the reduction
-        self.assertAlmostEqual(Decimal(projections['2027']), Decimal('18.0'), places=2)  # Still within lifetime
-        self.assertAlmostEqual(Decimal(projections['2028']), Decimal('0.0'), places=2)   # Beyond lifetime, should be 0
-
-        # Add a print statement to see the actual projections
-        print(f"Projected emissions: {projections}")
+        expected = np.array([
+            20.0,  # 2023: base emission
+            18.0,  # 2024: 10% reduction applied
+            18.0,  # 2025: should maintain the reduction
+            18.0,  # 2026: should maintain the reduction
+            18.0,  # 2027: still within lifetime
+            0.0,   # 2028: beyond lifetime, should be 0
+        ])
+        actual = np.array([float(projections[str(year)]) for year in range(2023, 2029)])
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=0.005)  # Same tolerance as places=2
 
     def test_progressive_modification(self):
         '''
@@ -241,109 +440,98 @@ class ProjectionViewSetTest(APITestCase):
         )
 
         # 2. Send POST request and check response
-        url = reverse('projection-project-modifications')
+        url = _url('projection-project-modifications')
         data = {
             "source_id": self.source.id,
             "modification_ids": [progressive_mod.id],
             "start_year": 2023,
             "end_year": 2027
         }
-        response = self.client.post(url, data, format='json')
+        response = _post_json(self.client, url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # 3. Verify projected emissions
         projections = response.data['projections']
-        expected_projections = {
-            '2023': Decimal('20.00'),  # Base emission
-            '2024': Decimal('26.67'),  # 1/3 increase
-            '2025': Decimal('33.33'),  # 2/3 increase
-            '2026': Decimal('40.00'),  # Full increase
-            '2027': Decimal('40.00'),  # Stays at full increase
-        }
-
-        for year, expected in expected_projections.items():
-            self.assertAlmostEqual(Decimal(projections[year]), expected, places=2)
+        expected = np.array([
+            20.00,  # 2023: base emission
+            26.67,  # 2024: 1/3 increase
+            33.33,  # 2025: 2/3 increase
+            40.00,  # 2026: full increase
+            40.00,  # 2027: stays at full increase
+        ])
+        actual = np.array([float(projections[str(year)]) for year in range(2023, 2028)])
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=0.005)  # Same tolerance as places=2
 
 class ReportModelTests(TestCase):
     '''
     Test cases for the Report model.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the Report model tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date=datetime.now().date())
-        self.source1 = Source.objects.create(
-            name="Source 1",
-            report=self.report,
-            category="TRANSPORT",
-            description="Test source 1",
-            method="DISTANCE",
-            emission_factor=0.1,
-            value=1000,
-            value_unit="km",
-            quantity=1,
-            lifetime=5,
-            acquisition_year=2020,
-            uncertainty=5
-        )
-        self.source2 = Source.objects.create(
-            name="Source 2",
-            report=self.report,
-            category="ENERGY",
-            description="Test source 2",
-            method="CONSUMPTION",
-            emission_factor=0.5,
-            value=500,
-            value_unit="kWh",
-            quantity=1,
-            lifetime=10,
-            acquisition_year=2022,
-            uncertainty=3
-        )
+        cls.report = Report.objects.create(name="Test Report", date=TODAY)
+        # Both sources are validated and inserted with a single bulk INSERT
+        cls.source1, cls.source2 = Source.objects.bulk_create_sources([
+            Source(
+                name="Source 1",
+                report=cls.report,
+                category="TRANSPORT",
+                description="Test source 1",
+                method="DISTANCE",
+                emission_factor=Decimal('0.1'),
+                value=1000,
+                value_unit="km",
+                quantity=1,
+                lifetime=5,
+                acquisition_year=2020,
+                uncertainty=5
+            ),
+            Source(
+                name="Source 2",
+                report=cls.report,
+                category="ENERGY",
+                description="Test source 2",
+                method="CONSUMPTION",
+                emission_factor=Decimal('0.5'),
+                value=500,
+                value_unit="kWh",
+                quantity=1,
+                lifetime=10,
+                acquisition_year=2022,
+                uncertainty=3
+            ),
+        ])
         # Add multiple reduction strategies on the same report
-        self.strategy1 = ReductionStrategy.objects.create(name="Strategy 1")
-        self.strategy2 = ReductionStrategy.objects.create(name="Strategy 2")
-        self.report.reduction_strategies.add(self.strategy1, self.strategy2)
+        cls.strategy1, cls.strategy2 = ReductionStrategy.objects.bulk_create([
+            ReductionStrategy(name="Strategy 1"),
+            ReductionStrategy(name="Strategy 2"),
+        ])
+        cls.report.reduction_strategies.add(cls.strategy1, cls.strategy2)
 
     def test_total_emissions(self):
         '''
         Test the calculation of total emissions for a report.
         '''
-        current_year = datetime.now().year
-        print(f"Current year: {current_year}")
 
         # Test total emissions for all sources
         total = self.report.total_emissions()
 
         # Calculate expected total based on the current implementation
-        source1_years_active = min(current_year - self.source1.acquisition_year + 1, self.source1.lifetime)
-        source2_years_active = min(current_year - self.source2.acquisition_year + 1, self.source2.lifetime)
+        source1_years_active = min(CURRENT_YEAR - self.source1.acquisition_year + 1, self.source1.lifetime)
+        source2_years_active = min(CURRENT_YEAR - self.source2.acquisition_year + 1, self.source2.lifetime)
 
         expected_total = (self.source1.emission_factor * self.source1.value * self.source1.quantity * source1_years_active +
                         self.source2.emission_factor * self.source2.value * self.source2.quantity * source2_years_active)
 
-        print(f"Source 1: emission_factor={self.source1.emission_factor}, value={self.source1.value}, "
-            f"quantity={self.source1.quantity}, lifetime={self.source1.lifetime}, "
-            f"acquisition_year={self.source1.acquisition_year}, years_active={source1_years_active}")
-        print(f"Source 2: emission_factor={self.source2.emission_factor}, value={self.source2.value}, "
-            f"quantity={self.source2.quantity}, lifetime={self.source2.lifetime}, "
-            f"acquisition_year={self.source2.acquisition_year}, years_active={source2_years_active}")
-        print(f"Total emissions: {total}")
-        print(f"Expected total: {expected_total}")
-
-        for source in self.report.sources.all():
-            print(f"Source {source.name} total emission: {source.total_emission}")
-
         self.assertAlmostEqual(total, expected_total, places=2)
 
         # Test total emissions for a specific year
         test_year = 2021
         total_2021 = self.report.total_emissions(test_year)
         expected_total_2021 = self.source1.emission_factor * self.source1.value * self.source1.quantity
-        print(f"Total emissions for {test_year}: {total_2021}")
-        print(f"Expected total for {test_year}: {expected_total_2021}")
         self.assertAlmostEqual(total_2021, expected_total_2021, places=2)
 
     def test_compare_emissions(self):
@@ -371,7 +559,6 @@ class ReportModelTests(TestCase):
         Test that the total emissions cache is updated correctly when a source is modified.
         '''
         initial_total = self.report.get_total_emissions()
-        print(f"Initial total emissions: {initial_total}")
 
         # Modify a source
         self.source1.value = 2000
@@ -382,23 +569,12 @@ class ReportModelTests(TestCase):
         updated_total = self.report.get_total_emissions()
 
         # Calculate expected updated total based on current model logic
-        current_year = datetime.now().year
-        years_active_source1 = min(current_year - self.source1.acquisition_year + 1, self.source1.lifetime)
-        years_active_source2 = min(current_year - self.source2.acquisition_year + 1, self.source2.lifetime)
+        years_active_source1 = min(CURRENT_YEAR - self.source1.acquisition_year + 1, self.source1.lifetime)
+        years_active_source2 = min(CURRENT_YEAR - self.source2.acquisition_year + 1, self.source2.lifetime)
 
         expected_updated_total = (self.source1.emission_factor * 2000 * self.source1.quantity * years_active_source1) + \
                                 (self.source2.emission_factor * self.source2.value * self.source2.quantity * years_active_source2)
 
-        print(f"Source 1: emission_factor={self.source1.emission_factor}, value=2000, "
-            f"quantity={self.source1.quantity}, lifetime={self.source1.lifetime}, "
-            f"acquisition_year={self.source1.acquisition_year}, years_active={years_active_source1}")
-        print(f"Source 2: emission_factor={self.source2.emission_factor}, value={self.source2.value}, "
-            f"quantity={self.source2.quantity}, lifetime={self.source2.lifetime}, "
-            f"acquisition_year={self.source2.acquisition_year}, years_active={years_active_source2}")
-        print(f"Current year: {current_year}")
-        print(f"Updated total emissions: {updated_total}")
-        print(f"Expected updated total: {expected_updated_total}")
-
         self.assertAlmostEqual(updated_total, expected_updated_total, places=2)
 
 class SignalTests(TestCase):
@@ -406,17 +582,21 @@ class SignalTests(TestCase):
     Test cases for signal handlers related to emissions calculations.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the signal tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
-            emission_factor=0.1,
+            description="Test source",
+            method="DISTANCE",
+            emission_factor=Decimal('0.1'),
             value=1000,
+            value_unit="km",
             quantity=1,
             lifetime=5,
             acquisition_year=2023,
@@ -429,7 +609,10 @@ class SignalTests(TestCase):
         '''
         initial_total = self.report.get_total_emissions()
         self.source.value = 2000
-        self.source.save()
+        # Report totals are recalculated once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.source.save()
+        self.report.refresh_from_db()
         self.assertNotEqual(initial_total, self.report.get_total_emissions())
 
     def test_update_report_emissions_on_source_delete(self):
@@ -437,27 +620,64 @@ class SignalTests(TestCase):
         Test that report emissions are updated when a source is deleted.
         '''
         initial_total = self.report.get_total_emissions()
-        self.source.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.source.delete()
+        self.report.refresh_from_db()
         self.assertNotEqual(initial_total, self.report.get_total_emissions())
         self.assertEqual(self.report.get_total_emissions(), 0)
 
+    def test_report_recalculated_once_per_transaction(self):
+        '''
+        Test that saving several sources of a report in one transaction recalculates the report once.
+        '''
+        with patch.object(Report, 'update_total_emissions', autospec=True,
+                          side_effect=Report.update_total_emissions) as update_total_emissions:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                with transaction.atomic():
+                    for value in (1500, 2000):
+                        self.source.value = value
+                        self.source.save()
+                    Source.objects.create(
+                        name="Second Source",
+                        report=self.report,
+                        category="ENERGY",
+                        description="Second test source",
+                        method="CONSUMPTION",
+                        emission_factor=Decimal('0.5'),
+                        value=500,
+                        value_unit="kWh",
+                        quantity=1,
+                        lifetime=10,
+                        acquisition_year=2023,
+                        uncertainty=3
+                    )
+
+        # One flush scheduled per save, only the first one recalculates the report
+        self.assertEqual(len(callbacks), 3)
+        update_total_emissions.assert_called_once()
+
+        self.report.refresh_from_db()
+        self.assertAlmostEqual(self.report.get_total_emissions(), self.report.total_emissions(), places=2)
+        self.assertNotEqual(self.report.get_total_emissions(), 0)
+
 class ReductionStrategyTests(TestCase):
     '''
     Test cases for the ReductionStrategy model and related calculations.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the ReductionStrategy tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date=datetime.now().date())
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date=TODAY)
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
             description="Test source",
             method="DISTANCE",
-            emission_factor=0.1,
+            emission_factor=Decimal('0.1'),
             value=1000,
             value_unit="km",
             quantity=1,
@@ -465,8 +685,8 @@ class ReductionStrategyTests(TestCase):
             acquisition_year=2020,
             uncertainty=5
         )
-        self.strategy = ReductionStrategy.objects.create(name="Test Strategy")
-        self.report.reduction_strategies.add(self.strategy)
+        cls.strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        cls.report.reduction_strategies.add(cls.strategy)
 
     def test_calculate_total_reduction(self):
         '''
@@ -484,12 +704,15 @@ class ReductionStrategyTests(TestCase):
             is_progressive=False
         )
 
-        reduction_2022 = calculate_total_reduction(self.strategy, 2022, 2022)
+        # Reports, sources and modifications, whatever the number of years or modifications
+        with self.assertNumQueries(3):
+            reduction_2022 = calculate_total_reduction(self.strategy, 2022, 2022)
         annual_emission = self.source.calculate_emission_for_year(2022)
-        expected_reduction_2022 = annual_emission * 0.1  # 10% of annual emission
+        expected_reduction_2022 = annual_emission * Decimal('0.1')  # 10% of annual emission
         self.assertAlmostEqual(reduction_2022, expected_reduction_2022, places=2)
 
-        reduction_2022_2024 = calculate_total_reduction(self.strategy, 2022, 2024)
+        with self.assertNumQueries(3):
+            reduction_2022_2024 = calculate_total_reduction(self.strategy, 2022, 2024)
         expected_reduction_2022_2024 = expected_reduction_2022 * 3  # 3 years of 10% reduction
         self.assertAlmostEqual(reduction_2022_2024, expected_reduction_2022_2024, places=2)
 
@@ -509,43 +732,78 @@ class ReductionStrategyTests(TestCase):
             is_progressive=True,
             target_value=Decimal('2000')  # Double the original value
         )
-        reduction_2022_2024 = calculate_total_reduction(self.strategy, 2022, 2024)
-        annual_emission = Decimal('0.1') * Decimal('1000') * Decimal('1')  # Total emission without considering lifetime
+        with self.assertNumQueries(3):
+            reduction_2022_2024 = calculate_total_reduction(self.strategy, 2022, 2024)
+        annual_emission = Decimal('100.0')  # 0.1 * 1000 * 1, total emission without considering lifetime
         expected_increase = sum([
-            annual_emission * (Decimal('1') / Decimal('3')),  # 2022
-            annual_emission * (Decimal('2') / Decimal('3')),  # 2023
-            annual_emission * Decimal('1')                    # 2024
+            annual_emission * _ONE_THIRD,   # 2022
+            annual_emission * _TWO_THIRDS,  # 2023
+            annual_emission * _ONE          # 2024
         ])
-        print(f"Calculated reduction: {reduction_2022_2024}")
-        print(f"Expected increase: {expected_increase}")
         self.assertAlmostEqual(reduction_2022_2024, -expected_increase, places=2)
 
+    def test_calculate_total_reduction_query_count(self):
+        '''
+        Test that the number of queries doesn't grow with the number of modifications or years.
+        '''
+        Modification.objects.bulk_create_with_order(
+            Modification(
+                reduction_strategy=self.strategy,
+                source=self.source,
+                modification_type="VALUE",
+                value=Decimal('0.9'),
+                start_year=start_year,
+                is_progressive=False
+            )
+            for start_year in range(2020, 2025)
+        )
+
+        # Reports, sources and modifications, for five modifications over five years
+        with self.assertNumQueries(3):
+            reduction = calculate_total_reduction(self.strategy, 2020, 2024)
+        # Each year multiplies the 100 of annual emission by one more 0.9
+        expected_reduction = sum(100 * (1 - 0.9 ** applied) for applied in range(1, 6))
+        self.assertAlmostEqual(float(reduction), expected_reduction, places=6)
+
+    def test_calculate_total_reduction_without_modifications(self):
+        '''
+        Test that a strategy without modifications skips reading the sources of its reports.
+        '''
+        # Reports and modifications only
+        with self.assertNumQueries(2):
+            reduction = calculate_total_reduction(self.strategy, 2020, 2024)
+        self.assertEqual(reduction, Decimal('0.0'))
+
 class ModificationModelTest(TestCase):
     '''
     Test cases for the Modification model.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the Modification model tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
+            description="Test source",
+            method="DISTANCE",
             emission_factor=Decimal('0.1'),
             value=Decimal('1000'),
+            value_unit="km",
             quantity=1,
             lifetime=5,
             acquisition_year=2023,
             uncertainty=5
         )
-        self.strategy = ReductionStrategy.objects.create(name="Test Strategy")
-        self.report.reduction_strategies.add(self.strategy)
-        self.modification = Modification.objects.create(
-            reduction_strategy=self.strategy,
-            source=self.source,
+        cls.strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        cls.report.reduction_strategies.add(cls.strategy)
+        cls.modification = Modification.objects.create(
+            reduction_strategy=cls.strategy,
+            source=cls.source,
             modification_type="VALUE",
             value=Decimal('0.9'),
             order=1,
@@ -589,7 +847,7 @@ class ModificationModelTest(TestCase):
         )
         base_emission = Decimal('100')
         modified = prog_mod.calculate_modified_emission(base_emission)
-        expected = base_emission * (Decimal('1000') + (Decimal('2000') - Decimal('1000')) * (Decimal('2') / Decimal('3'))) / Decimal('1000')
+        expected = base_emission * (Decimal('1000') + Decimal('1000') * _TWO_THIRDS) / Decimal('1000')  # 2/3 of the way to 2000
         self.assertAlmostEqual(modified, expected, places=2)
 
 class EdgeCaseModelTests(TestCase):
@@ -601,21 +859,24 @@ class EdgeCaseModelTests(TestCase):
         '''
         Test the behavior of a source with a future acquisition year.
         '''
-        future_year = datetime.now().year + 5
+        future_year = CURRENT_YEAR + 5
         report = Report.objects.create(name="Future Report", date="2023-01-01")
         source = Source.objects.create(
             name="Future Source",
             report=report,
             category="TRANSPORT",
-            emission_factor=0.1,
+            description="Test source",
+            method="DISTANCE",
+            emission_factor=Decimal('0.1'),
             value=1000,
+            value_unit="km",
             quantity=1,
             lifetime=5,
             acquisition_year=future_year,
             uncertainty=5
         )
         self.assertEqual(source.total_emission, 0)
-        self.assertEqual(source.calculate_emission_for_year(datetime.now().year), 0)
+        self.assertEqual(source.calculate_emission_for_year(CURRENT_YEAR), 0)
 
     def test_modification_outside_source_lifetime(self):
         '''
@@ -626,8 +887,11 @@ class EdgeCaseModelTests(TestCase):
             name="Test Source",
             report=report,
             category="TRANSPORT",
+            description="Test source",
+            method="DISTANCE",
             emission_factor=Decimal('0.1'),
             value=1000,
+            value_unit="km",
             quantity=1,
             lifetime=5,
             acquisition_year=2023,
@@ -646,22 +910,82 @@ class EdgeCaseModelTests(TestCase):
         )
         self.assertEqual(modification.calculate_modified_emission(), Decimal('0'))
 
+    def _zero_emission_factor_modification(self):
+        '''
+        Create a source with a zero emission factor and an EF modification of it from 2024 on.
+        '''
+        report = Report.objects.create(name="Zero EF Report", date="2023-01-01")
+        source = Source.objects.create(
+            name="Zero EF Source",
+            report=report,
+            category="TRANSPORT",
+            description="Test source",
+            method="DISTANCE",
+            emission_factor=Decimal('0'),
+            value=1000,
+            value_unit="km",
+            quantity=1,
+            lifetime=5,
+            acquisition_year=2023,
+            uncertainty=5
+        )
+        strategy = ReductionStrategy.objects.create(name="Zero EF Strategy")
+        report.reduction_strategies.add(strategy)
+        modification = Modification.objects.create(
+            reduction_strategy=strategy,
+            source=source,
+            modification_type="EF",
+            value=Decimal('0.2'),
+            order=1,
+            start_year=2024,
+            is_progressive=False
+        )
+        return report, source, strategy, modification
+
+    def test_projected_total_emissions_zero_emission_factor(self):
+        '''
+        Test that an EF modification sets the projected emission of a source with a zero emission factor.
+        '''
+        report, source, strategy, modification = self._zero_emission_factor_modification()
+        self.assertEqual(report.projected_total_emissions(2025), Decimal('0'))
+        # New factor * value * quantity
+        self.assertAlmostEqual(float(report.projected_total_emissions(2025, [strategy])), 200.0)
+
+    def test_apply_modifications_zero_emission_factor(self):
+        '''
+        Test that apply_modifications sets the emissions of a source with a zero emission factor
+        in the years the source is active.
+        '''
+        report, source, strategy, modification = self._zero_emission_factor_modification()
+        years = np.arange(2022, 2030)
+        emissions = apply_modifications(np.zeros(years.size), source, [modification], years)
+        np.testing.assert_allclose(emissions, [0, 0, 200, 200, 200, 200, 0, 0])
+
+    def test_calculate_total_reduction_zero_emission_factor(self):
+        '''
+        Test that the total reduction of an EF modification of a source with a zero emission factor
+        is finite, the modified emissions being new factor * value * quantity.
+        '''
+        report, source, strategy, modification = self._zero_emission_factor_modification()
+        self.assertAlmostEqual(float(calculate_total_reduction(strategy, 2024, 2025)), -400.0)
+
 # ——————————————————————————————— Integration tests ————————————————————————————————————
 
 class EmissionIntegrationTests(TestCase):
     '''
     Integration tests for the emissions calculation system.
     '''
+    client_class = APIClient
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for the integration tests.
         '''
-        self.client = APIClient()
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.source = Source.objects.create(
             name="Test Source",
-            report=self.report,
+            report=cls.report,
             category="TRANSPORT",
             description="Test description",
             method="DISTANCE",
@@ -673,8 +997,8 @@ class EmissionIntegrationTests(TestCase):
             acquisition_year=2023,
             uncertainty=Decimal('5.0')
         )
-        self.strategy = ReductionStrategy.objects.create(name="Test Strategy")
-        self.report.reduction_strategies.add(self.strategy)
+        cls.strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        cls.report.reduction_strategies.add(cls.strategy)
 
     def test_create_modification_and_calculate_reduction(self):
         '''
@@ -690,11 +1014,11 @@ class EmissionIntegrationTests(TestCase):
             "start_year": 2024,
             "is_progressive": False
         }
-        response = self.client.post(reverse('modification-list'), modification_data)
+        response = self.client.post(_url('modification-list'), modification_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
         # Calculate total reduction
-        response = self.client.get(reverse('reductionstrategy-total-reduction', args=[self.strategy.id]), {'start_year': 2024, 'end_year': 2025})
+        response = self.client.get(_url('reductionstrategy-total-reduction', self.strategy.id), {'start_year': 2024, 'end_year': 2025})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Verify the calculated reduction
@@ -708,94 +1032,419 @@ class EmissionIntegrationTests(TestCase):
         '''
         strategy2 = ReductionStrategy.objects.create(name="Test Strategy 2")
 
-        # Check initial state
-        print(f"Initial strategies: {list(self.report.reduction_strategies.all())}")
-        print(f"Strategy 1 ID: {self.strategy.id}, Strategy 2 ID: {strategy2.id}")
-
-        response = self.client.post(reverse('report-add-strategy', args=[self.report.id]), {'strategy_id': strategy2.id})
-        print(f"Response status: {response.status_code}")
-        print(f"Response content: {response.content}")
-
+        response = self.client.post(_url('report-add-strategy', self.report.id), {'strategy_id': strategy2.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         self.report.refresh_from_db()
-        print(f"Strategies after adding: {list(self.report.reduction_strategies.all())}")
 
         self.assertEqual(self.report.reduction_strategies.count(), 2)
         self.assertIn(self.strategy, self.report.reduction_strategies.all())
         self.assertIn(strategy2, self.report.reduction_strategies.all())
 
-        if self.report.reduction_strategies.count() != 2:
-            print(f"Strategy 1 (ID: {self.strategy.id}) in report: {self.strategy in self.report.reduction_strategies.all()}")
-            print(f"Strategy 2 (ID: {strategy2.id}) in report: {strategy2 in self.report.reduction_strategies.all()}")
-            print(f"All strategies in report: {self.report.reduction_strategies.all()}")
+    def test_add_and_remove_strategies_in_bulk(self):
+        '''
+        Test adding and removing several reduction strategies to a report in one request.
+        '''
+        strategies = ReductionStrategy.objects.bulk_create(
+            ReductionStrategy(name=f"Bulk Strategy {i}") for i in range(2)
+        )
+        strategy_ids = [strategy.id for strategy in strategies]
+
+        response = _post_json(self.client, _url('report-add-strategy', self.report.id), {'strategy_ids': strategy_ids})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.report.reduction_strategies.count(), 3)
+
+        response = _post_json(self.client, _url('report-remove-strategy', self.report.id), {'strategy_ids': strategy_ids})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(self.report.reduction_strategies.all()), [self.strategy])
+
+        response = _post_json(self.client, _url('report-add-strategy', self.report.id), {'strategy_ids': [0]})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_add_and_remove_strategies_invalid_ids(self):
+        '''
+        Test that strategy_ids which are not a list of integers are rejected.
+        '''
+        for strategy_ids in ("12", 5, {"id": 1}, [None], ["abc"]):
+            for url_name in ('report-add-strategy', 'report-remove-strategy'):
+                with self.subTest(strategy_ids=strategy_ids, url_name=url_name):
+                    response = _post_json(self.client, _url(url_name, self.report.id), {'strategy_ids': strategy_ids})
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = _post_json(self.client, _url('report-add-strategy', self.report.id), {'strategy_id': [1]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(self.report.reduction_strategies.all()), [self.strategy])
+
+    def test_calculate_total_reduction_reuses_modifications(self):
+        '''
+        Test that the total reduction and the packed modifications of a strategy are reused until one of them changes.
+        '''
+        modification = Modification.objects.create(
+            reduction_strategy=self.strategy,
+            source=self.source,
+            modification_type="VALUE",
+            value=Decimal('0.9'),
+            order=1,
+            start_year=2024,
+            is_progressive=False
+        )
+        self.assertAlmostEqual(float(calculate_total_reduction(self.strategy, 2024, 2025)), 20.0)
+
+        # The reports only, the total is served from the cache
+        with self.assertNumQueries(1):
+            self.assertAlmostEqual(float(calculate_total_reduction(self.strategy, 2024, 2025)), 20.0)
+
+        # Reports and sources only, the modifications are not fetched again for another start year
+        with self.assertNumQueries(2):
+            self.assertAlmostEqual(float(calculate_total_reduction(self.strategy, 2025, 2025)), 10.0)
+
+        modification.value = Decimal('0.5')
+        modification.save()
+        self.assertAlmostEqual(float(calculate_total_reduction(self.strategy, 2024, 2025)), 100.0)
 
 class APIEndpointTests(APITestCase):
     '''
     Test cases for API endpoints.
+
+    The fixtures are created once for the class in setUpTestData, and each test runs in a
+    savepoint of the class transaction. The list and detail tests are read-only, tests that
+    write (like test_projected_emissions_cached) are rolled back to the savepoint.
     '''
+    databases = {'default'}
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for API endpoint tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
-        self.source = Source.objects.create(
-            name="Test Source",
-            report=self.report,
-            category="TRANSPORT",
-            emission_factor=0.1,
-            value=1000,
-            quantity=1,
-            lifetime=5,
-            acquisition_year=2023,
-            uncertainty=5
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        # Several sources, so the list queries are checked against more than one row.
+        # One multi-row INSERT, the report totals are not used by these tests.
+        cls.sources = Source.objects.bulk_create([
+            Source(
+                name=f"Test Source {i}",
+                report=cls.report,
+                category="TRANSPORT",
+                emission_factor=0.1,
+                value=1000,
+                quantity=1,
+                lifetime=5,
+                acquisition_year=2023,
+                uncertainty=5
+            )
+            for i in range(3)
+        ])
+        cls.source = cls.sources[0]
+        cls.reduction_strategy = ReductionStrategy.objects.create(name="Test Strategy")
+        Modification.objects.bulk_create_with_order(
+            Modification(
+                reduction_strategy=cls.reduction_strategy,
+                source=source,
+                modification_type="VALUE",
+                value=Decimal('0.9'),
+                start_year=2024
+            )
+            for source in cls.sources
         )
 
     def test_report_list(self):
         '''
-        Test the report list endpoint.
+        Test the report list endpoint. Read-only, does not modify the class data.
         '''
-        url = reverse('report-list')
-        response = self.client.get(url)
+        url = _url('report-list')
+        # Reports and their prefetched strategies, whatever the number of reports
+        with self.assertNumQueries(2):
+            response = _client.get(url)
+            data = _streamed_json(response)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(data), 1)
 
     def test_source_list(self):
         '''
-        Test the source list endpoint.
+        Test the source list endpoint. Read-only, does not modify the class data.
+        '''
+        url = _url('source-list')
+        # Emissions are annotated and report is rendered from report_id, so one SELECT for any number of sources
+        with self.assertNumQueries(1):
+            response = _client.get(url)
+            data = _streamed_json(response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(data), len(self.sources))
+
+    def test_source_list_streamed_in_chunks(self):
+        '''
+        Test that a list longer than one chunk is streamed as a single JSON array.
+        Read-only, does not modify the class data.
+        '''
+        with patch.object(SourceList, 'stream_chunk_size', 2):
+            response = _client.get(_url('source-list'))
+            data = _streamed_json(response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([source['id'] for source in data], [s.id for s in self.sources])
+
+    def test_report_list_error(self):
+        '''
+        Test that an error while serializing the first chunk is returned as a 500 error, not a truncated 200.
+        Read-only, does not modify the class data.
+        '''
+        with patch.object(ReportSerializer, 'to_representation', side_effect=RuntimeError("serialization failed")):
+            response = _client.get(_url('report-list'))
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.json(), {"error": "An error occurred while retrieving reports"})
+
+    def test_source_list_error_after_first_chunk(self):
+        '''
+        Test that an error in a later chunk is logged and ends the streamed list with an error item.
+        Read-only, does not modify the class data.
+        '''
+        to_representation = SourceSerializer.to_representation
+
+        def fail_after_first_source(serializer, instance):
+            if instance.pk != self.sources[0].pk:
+                raise RuntimeError("serialization failed")
+            return to_representation(serializer, instance)
+
+        with patch.object(SourceList, 'stream_chunk_size', 1), \
+                patch.object(SourceSerializer, 'to_representation', autospec=True, side_effect=fail_after_first_source), \
+                self.assertLogs('emissions.views', level='ERROR'):
+            response = _client.get(_url('source-list'))
+            data = _streamed_json(response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data[0]['id'], self.sources[0].id)
+        self.assertEqual(data[1:], [{"error": "An error occurred while streaming the list, it is incomplete"}])
+
+    def test_source_list_paginated(self):
+        '''
+        Test that the source list is paginated in SQL when a page size is requested.
+        Read-only, does not modify the class data.
+        '''
+        url = _url('source-list')
+        # One COUNT and one SELECT with LIMIT
+        with self.assertNumQueries(2):
+            response = _client.get(url, {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], len(self.sources))
+        self.assertEqual([source['id'] for source in response.data['results']], [s.id for s in self.sources[:2]])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_report_sources(self):
+        '''
+        Test the report sources endpoint, streamed whole or paginated on request.
+        Read-only, does not modify the class data.
         '''
-        url = reverse('source-list')
-        response = self.client.get(url)
+        url = _url('report-sources', self.report.id)
+        response = _client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(_streamed_json(response)), len(self.sources))
+
+        response = _client.get(url, {'page': 2, 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+        response = _client.get(_url('report-sources', self.report.id + 1))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reduction_strategy_list(self):
+        '''
+        Test the reduction strategy list endpoint. Read-only, does not modify the class data.
+        '''
+        url = _url('reductionstrategy-list')
+        with self.assertNumQueries(1):
+            response = _client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_modification_list(self):
+        '''
+        Test the modification list endpoint. Read-only, does not modify the class data.
+        '''
+        url = _url('modification-list')
+        # Strategy and source links are built from the foreign key ids, no join or per-row query
+        with self.assertNumQueries(1):
+            response = _client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(self.sources))
+
     def test_report_detail(self):
         '''
-        Test the report detail endpoint.
+        Test the report detail endpoint. Read-only, does not modify the class data.
         '''
-        url = reverse('report-detail', args=[self.report.id])
-        response = self.client.get(url)
+        url = _url('report-detail', self.report.id)
+        response = _client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], "Test Report")
 
+    def test_projected_emissions_cached(self):
+        '''
+        Test that projected emissions are served from the cache until a source changes.
+        '''
+        url = _url('report-projected-emissions', self.report.id)
+        response = _client.get(url, {'year': 2023})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertAlmostEqual(float(response.data['projected_emissions']), 300.0, places=2)
+
+        # A hit only loads the report to build the key
+        with self.assertNumQueries(1):
+            response = _client.get(url, {'year': 2023})
+        self.assertAlmostEqual(float(response.data['projected_emissions']), 300.0, places=2)
+
+        self.source.value = 2000
+        with self.captureOnCommitCallbacks(execute=True):
+            self.source.save(validate=False)
+        response = _client.get(url, {'year': 2023})
+        self.assertAlmostEqual(float(response.data['projected_emissions']), 400.0, places=2)
+
+    def test_projected_emissions_invalid_parameters(self):
+        '''
+        Test that an invalid year or strategies parameter gives a 400 error with the field details.
+        Read-only, does not modify the class data.
+        '''
+        url = _url('report-projected-emissions', self.report.id)
+        for params, field in (({'year': 'abc'}, 'year'), ({'year': 1800}, 'year'), ({'strategies': 'abc'}, 'strategies')):
+            with self.subTest(params=params):
+                response = _client.get(url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['error'], "Invalid year or strategies parameter")
+                self.assertIn(field, response.data['details'])
+
+    @skipUnless(settings.ENABLE_DASHBOARD, "The dashboard is not mounted")
+    def test_dashboard_url(self):
+        '''
+        Test that the dashboard is only mounted at /dashboard/, not under the API.
+        Read-only, does not modify the class data.
+        '''
+        self.assertEqual(reverse('dashboard'), '/dashboard/')
+        self.assertEqual(_client.get('/dashboard/').status_code, status.HTTP_200_OK)
+        self.assertEqual(_client.get('/api/dashboard/').status_code, status.HTTP_404_NOT_FOUND)
+
+class SourceBulkCreateTests(APITestCase):
+    '''
+    Test cases for the bulk source creation endpoint.
+    '''
+
+    def setUp(self):
+        '''
+        Set up test data for the bulk creation tests.
+        '''
+        self.report = Report.objects.create(name="Bulk Report", date="2023-01-01")
+
+    def source_data(self, name, **overrides):
+        '''
+        Build the payload for a single source.
+        '''
+        data = {
+            "name": name,
+            "report": self.report.id,
+            "category": "TRANSPORT",
+            "description": "Test description",
+            "method": "DISTANCE",
+            "emission_factor": "0.1",
+            "value": "1000",
+            "value_unit": "km",
+            "quantity": 1,
+            "lifetime": 5,
+            "acquisition_year": 2023,
+            "uncertainty": 5,
+            "year": None
+        }
+        data.update(overrides)
+        return data
+
+    def test_bulk_create_sources(self):
+        '''
+        Test that all sources are created and the report total is recalculated.
+        '''
+        url = _url('source-bulk-create')
+        data = [self.source_data(f"Bulk Source {i}") for i in range(3)]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = _post_json(self.client, url, data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(self.report.sources.count(), 3)
+
+        self.report.refresh_from_db()
+        self.assertAlmostEqual(self.report.total_emissions_cache, self.report.total_emissions(), places=2)
+
+    def test_bulk_create_sources_stored_annual_emission(self):
+        '''
+        Test that the database fills the generated annual emission column of bulk created sources.
+        '''
+        url = _url('source-bulk-create')
+        data = [self.source_data(f"Bulk Source {i}", quantity=i + 1) for i in range(3)]
+        response = _post_json(self.client, url, data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        stored = Source.objects.order_by('quantity').values_list('stored_annual_emission', flat=True)
+        np.testing.assert_allclose(list(stored), [100.0, 200.0, 300.0])
+
+    def test_bulk_create_sources_invalid(self):
+        '''
+        Test that no source is created when one of them fails model validation.
+        '''
+        url = _url('source-bulk-create')
+        data = [self.source_data("Valid Source"), self.source_data("Invalid Source", quantity=0)]
+        response = _post_json(self.client, url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('1.quantity', response.data['error'])
+        self.assertEqual(self.report.sources.count(), 0)
+
+    def test_bulk_create_sources_duplicate_names(self):
+        '''
+        Test that names repeated in the batch or already taken are rejected before inserting.
+        '''
+        url = reverse('source-bulk-create')
+        response = _post_json(self.client, url, [self.source_data("Existing Source")])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = [self.source_data("Existing Source"), self.source_data("New Source"), self.source_data("New Source")]
+        response = _post_json(self.client, url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for index in range(3):
+            self.assertIn(f'{index}.name', response.data['error'])
+        self.assertEqual(self.report.sources.count(), 1)
+
+    def test_bulk_create_sources_unknown_report(self):
+        '''
+        Test that a source of a report that does not exist is rejected.
+        '''
+        url = reverse('source-bulk-create')
+        data = [self.source_data("Valid Source"), self.source_data("Orphan Source", report=self.report.id + 1)]
+        response = _post_json(self.client, url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('1.report', response.data['error'])
+        self.assertEqual(Source.objects.count(), 0)
+
+    def test_bulk_create_sources_query_count(self):
+        '''
+        Test that the number of queries does not depend on the number of sources.
+        '''
+        url = reverse('source-bulk-create')
+        for count in (2, 20):
+            data = [self.source_data(f"Bulk Source {count}-{i}") for i in range(count)]
+            # The reports, the existing names and one INSERT
+            with self.assertNumQueries(3):
+                response = _post_json(self.client, url, data)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(len(response.data), count)
+
 class EdgeCaseAPITests(APITestCase):
     '''
     Test cases for edge cases in API interactions.
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         '''
         Set up test data for edge case API tests.
         '''
-        self.report = Report.objects.create(name="Test Report", date="2023-01-01")
+        cls.report = Report.objects.create(name="Test Report", date="2023-01-01")
 
     def test_create_source_future_acquisition(self):
         '''
         Test creating a source with a future acquisition year.
         '''
-        future_year = datetime.now().year + 5
-        url = reverse('source-list')
+        future_year = CURRENT_YEAR + 5
+        url = _url('source-list')
         data = {
             "name": "Future Source",
             "report": self.report.id,
@@ -809,23 +1458,17 @@ class EdgeCaseAPITests(APITestCase):
             "lifetime": 5,
             "acquisition_year": future_year,
             "uncertainty": 5,
-            "year": datetime.now().year
+            # A year-specific source must fall within its own lifetime
+            "year": future_year
         }
-        print(f"Sending data: {data}")
-        response = self.client.post(url, data, format='json')
-        print(f"Response status: {response.status_code}")
-        print(f"Response content: {response.content}")
+        response = _post_json(self.client, url, data)
 
+        # The response body is only formatted when the request failed
         if response.status_code != status.HTTP_201_CREATED:
-            print(f"Detailed response data: {response.data}")
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        if response.status_code == status.HTTP_201_CREATED:
-            created_source = Source.objects.get(id=response.data['id'])
-            self.assertEqual(created_source.total_emission, 0)
-            self.assertEqual(created_source.report_id, self.report.id)
-        else:
-            self.fail(f"Failed to create source. Errors: {response.content}")
+            self.fail(f"Failed to create source ({response.status_code}). Errors: {response.content}")
+        created_source = Source.objects.get(id=response.data['id'])
+        self.assertEqual(created_source.total_emission, 0)
+        self.assertEqual(created_source.report_id, self.report.id)
 
     def test_calculate_emissions_before_acquisition(self):
         '''
@@ -835,18 +1478,21 @@ class EdgeCaseAPITests(APITestCase):
             name="Test Source",
             report=self.report,
             category="TRANSPORT",
-            emission_factor=0.1,
+            description="Test source",
+            method="DISTANCE",
+            emission_factor=Decimal('0.1'),
             value=1000,
+            value_unit="km",
             quantity=1,
             lifetime=5,
             acquisition_year=2023,
             uncertainty=5
         )
-        url = reverse('source-emissions-by-year', args=[source.id])
-        response = self.client.get(url, {'start_year': 2020, 'end_year': 2025})
+        url = _url('source-emissions-by-year', source.id)
+        response = _client.get(url, {'start_year': 2020, 'end_year': 2025})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Convert expected keys to int before comparison
-        self.assertEqual(response.data[int('2020')], 0)
-        self.assertEqual(response.data[int('2021')], 0)
-        self.assertEqual(response.data[int('2022')], 0)
-        self.assertGreater(response.data[int('2023')], 0)
\ No newline at end of file
+        # response.data is the view's dict, keyed by int year (JSON rendering stringifies them)
+        self.assertEqual(response.data[2020], 0)
+        self.assertEqual(response.data[2021], 0)
+        self.assertEqual(response.data[2022], 0)
+        self.assertGreater(response.data[2023], 0)
\ No newline at end of file
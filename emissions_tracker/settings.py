@@ -31,6 +31,10 @@ DEBUG = 'True'
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(' ')
 
+# Optional parts of the site, API-only deployments can turn them off
+ENABLE_ADMIN = os.getenv('ENABLE_ADMIN', 'True') == 'True'
+ENABLE_DASHBOARD = os.getenv('ENABLE_DASHBOARD', 'True') == 'True'
+
 
 # Application definition
 
@@ -46,6 +50,10 @@ INSTALLED_APPS = [
     'emissions',
 ]
 
+# Without the admin, its ModelAdmin classes are not autodiscovered at startup
+if not ENABLE_ADMIN:
+    INSTALLED_APPS.remove('django.contrib.admin')
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -137,6 +145,14 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# JSON is rendered with orjson, the browsable API stays available
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'emissions.utils.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -1,11 +1,19 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
 from django.views.generic import RedirectView
-from emissions.views import DashboardView
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/', include('emissions.urls')),
-    path('dashboard/', DashboardView.as_view(), name='dashboard'),
-    path('', RedirectView.as_view(url='/dashboard/', permanent=True), name='index'),
-]
\ No newline at end of file
+]
+
+# The admin and the dashboard are only mounted, and their URL modules only imported, when enabled
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.append(path('admin/', admin.site.urls))
+
+if settings.ENABLE_DASHBOARD:
+    urlpatterns += [
+        path('dashboard/', include('emissions.dashboard_urls')),
+        path('', RedirectView.as_view(url='/dashboard/', permanent=True), name='index'),
+    ]
\ No newline at end of file